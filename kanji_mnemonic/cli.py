@@ -35,7 +35,7 @@ from .data import (
     save_personal_sound_mnemonic,
     save_reading_override,
 )
-from .lookup import format_profile, lookup_kanji, reverse_lookup_radical
+from .lookup import RadicalNameIndex, format_profile, make_kanji_lookup
 from .prompt import build_prompt, get_system_prompt
 
 # Load .env — checks cwd first, then home directory
@@ -68,15 +68,14 @@ def load_all_data(wk_api_key: str | None):
         wk_kanji_subjects = fetch_wk_kanji_subjects(wk_api_key)
     else:
         # Try to load from cache even without key
-        from .data import CACHE_DIR
-        import json
+        from .data import CACHE_DIR, _read_cache
 
         rad_cache = CACHE_DIR / "wk_radicals.json"
         subj_cache = CACHE_DIR / "wk_kanji_subjects.json"
         if rad_cache.exists():
-            wk_radicals = json.loads(rad_cache.read_text(encoding="utf-8"))
+            wk_radicals = _read_cache(rad_cache)
         if subj_cache.exists():
-            wk_kanji_subjects = json.loads(subj_cache.read_text(encoding="utf-8"))
+            wk_kanji_subjects = _read_cache(subj_cache)
         if not wk_radicals:
             print(
                 "Warning: No WK_API_KEY set and no cached radical data.",
@@ -126,21 +125,22 @@ def cmd_lookup(
     """Just show the kanji profile without generating a mnemonic."""
     from .prompt import _get_relevant_sound_mnemonics
 
+    lookup = make_kanji_lookup(
+        kanji_db,
+        phonetic_db,
+        wk_kanji_db,
+        wk_radicals,
+        wk_kanji_subjects,
+        kradfile,
+        kanjidic,
+        personal_radicals=personal_radicals,
+        infer_phonetic=not getattr(args, "no_infer", False),
+        personal_decompositions=personal_decompositions,
+        reading_overrides=reading_overrides,
+    )
+
     for char in args.kanji:
-        profile = lookup_kanji(
-            char,
-            kanji_db,
-            phonetic_db,
-            wk_kanji_db,
-            wk_radicals,
-            wk_kanji_subjects,
-            kradfile,
-            kanjidic,
-            personal_radicals=personal_radicals,
-            infer_phonetic=not getattr(args, "no_infer", False),
-            personal_decompositions=personal_decompositions,
-            reading_overrides=reading_overrides,
-        )
+        profile = lookup(char)
         print(
             format_profile(
                 profile,
@@ -205,21 +205,22 @@ def cmd_memorize(
     """Generate a mnemonic for the given kanji."""
     client = get_anthropic_client()
 
+    lookup = make_kanji_lookup(
+        kanji_db,
+        phonetic_db,
+        wk_kanji_db,
+        wk_radicals,
+        wk_kanji_subjects,
+        kradfile,
+        kanjidic,
+        personal_radicals=personal_radicals,
+        infer_phonetic=not getattr(args, "no_infer", False),
+        personal_decompositions=personal_decompositions,
+        reading_overrides=reading_overrides,
+    )
+
     for char in args.kanji:
-        profile = lookup_kanji(
-            char,
-            kanji_db,
-            phonetic_db,
-            wk_kanji_db,
-            wk_radicals,
-            wk_kanji_subjects,
-            kradfile,
-            kanjidic,
-            personal_radicals=personal_radicals,
-            infer_phonetic=not getattr(args, "no_infer", False),
-            personal_decompositions=personal_decompositions,
-            reading_overrides=reading_overrides,
-        )
+        profile = lookup(char)
 
         # Apply one-shot --primary override
         if getattr(args, "primary", None):
@@ -279,21 +280,22 @@ def cmd_prompt(
     sound_mnemonics,
 ):
     """Show the assembled prompt without calling the LLM."""
+    lookup = make_kanji_lookup(
+        kanji_db,
+        phonetic_db,
+        wk_kanji_db,
+        wk_radicals,
+        wk_kanji_subjects,
+        kradfile,
+        kanjidic,
+        personal_radicals=personal_radicals,
+        infer_phonetic=not getattr(args, "no_infer", False),
+        personal_decompositions=personal_decompositions,
+        reading_overrides=reading_overrides,
+    )
+
     for char in args.kanji:
-        profile = lookup_kanji(
-            char,
-            kanji_db,
-            phonetic_db,
-            wk_kanji_db,
-            wk_radicals,
-            wk_kanji_subjects,
-            kradfile,
-            kanjidic,
-            personal_radicals=personal_radicals,
-            infer_phonetic=not getattr(args, "no_infer", False),
-            personal_decompositions=personal_decompositions,
-            reading_overrides=reading_overrides,
-        )
+        profile = lookup(char)
         print("── SYSTEM PROMPT ──")
         print(get_system_prompt())
         print()
@@ -350,9 +352,10 @@ def cmd_decompose(
         return
 
     # --- Resolve parts ---
+    radical_names = RadicalNameIndex(wk_radicals, personal_radicals)
     resolved_parts = []
     for part in args.parts:
-        resolved = _resolve_part(part, wk_radicals, personal_radicals)
+        resolved = _resolve_part(part, radical_names)
         if resolved is None:
             print(
                 f'Error: "{part}" is not a known radical name. '
@@ -365,7 +368,7 @@ def cmd_decompose(
     # Resolve -p and -s values
     phonetic = None
     if args.phonetic:
-        phonetic = _resolve_part(args.phonetic, wk_radicals, personal_radicals)
+        phonetic = _resolve_part(args.phonetic, radical_names)
         if phonetic is None:
             print(
                 f'Error: "{args.phonetic}" is not a known radical name. '
@@ -376,7 +379,7 @@ def cmd_decompose(
 
     semantic = None
     if args.semantic:
-        semantic = _resolve_part(args.semantic, wk_radicals, personal_radicals)
+        semantic = _resolve_part(args.semantic, radical_names)
         if semantic is None:
             print(
                 f'Error: "{args.semantic}" is not a known radical name. '
@@ -415,11 +418,11 @@ def cmd_decompose(
     print(f"Saved: {char} → {', '.join(parts_display)}")
 
 
-def _resolve_part(part, wk_radicals, personal_radicals):
+def _resolve_part(part, radical_names):
     """Resolve a part string to a character. Single chars pass through; words are reverse-looked-up."""
     if len(part) == 1:
         return part
-    return reverse_lookup_radical(part, wk_radicals, personal_radicals)
+    return radical_names.get(part)
 
 
 def _resolve_name(char, wk_radicals, personal_radicals, wk_kanji_db, kanjidic):
@@ -564,7 +567,8 @@ def cmd_clear_cache(_args, *_data):
     clear_cache()
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the kanji CLI."""
     parser = argparse.ArgumentParser(
         prog="kanji",
         description="Generate kanji mnemonics using WaniKani radicals and phonetic-semantic data",
@@ -734,6 +738,11 @@ def main():
     # --- clear-cache ---
     subparsers.add_parser("clear-cache", help="Remove cached database files")
 
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
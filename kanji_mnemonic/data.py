@@ -4,10 +4,15 @@ import importlib.resources
 import io
 import json
 import os
+import queue
+import sys
 import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 CACHE_DIR = Path(
     os.environ.get("KANJI_MNEMONIC_CACHE", Path.home() / ".cache" / "kanji-mnemonic")
@@ -30,13 +35,86 @@ KRADFILE_URLS = [
 
 WK_API_BASE = "https://api.wanikani.com/v2"
 
+# (connect, read) seconds; connects fail fast, large bodies get time to arrive
+_TIMEOUT = (3.05, 30)
+
+
+def _make_session() -> requests.Session:
+    """Build the shared HTTP session: keep-alive pooling plus retries on 5xx.
+
+    Every download goes through one session so paginated WK fetches reuse a
+    single TLS connection instead of handshaking per page.  Retries give up
+    by returning the last response, so raise_for_status() still reports it.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
 
 def ensure_cache_dir():
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _freeze(obj):
+    """Canonicalize a loaded database: intern characters, freeze lists as tuples.
+
+    Kanji and radical characters repeat across every database (as keys,
+    components, and compound lists), so dict keys and single-character strings
+    are interned to share one object.  Lists become tuples, since databases are
+    only ever read after loading; lookup code copies what it keeps.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k): _freeze(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str) and len(obj) == 1:
+        return sys.intern(obj)
+    return obj
+
+
+def _read_cache(path: Path) -> dict:
+    """Load a cached database JSON file in its frozen, interned form.
+
+    Reading bytes skips read_text()'s TextIOWrapper and newline translation;
+    json.loads() still decodes them to a str before parsing.
+    """
+    return _freeze(json.loads(path.read_bytes()))
+
+
+def _write_cache(path: Path, data: dict) -> None:
+    """Write a database cache in one call, atomically.
+
+    The JSON is encoded compactly up front and written to a sibling temp
+    file, then renamed over the cache, so an interrupted write never leaves a
+    truncated cache file behind for the next run to choke on. If the write or
+    rename fails, the temp file is removed before the error propagates.
+    """
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(body.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # ENOSPC, EPERM, Ctrl-C...: don't leave the partial temp file behind
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _download_json(url: str) -> dict:
-    resp = requests.get(url, timeout=30)
+    resp = _SESSION.get(url, timeout=_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
@@ -45,11 +123,11 @@ def _load_or_download(name: str, url: str) -> dict:
     ensure_cache_dir()
     cache_path = CACHE_DIR / f"{name}.json"
     if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
+        return _read_cache(cache_path)
     print(f"Downloading {name}...")
     data = _download_json(url)
-    cache_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
-    return data
+    _write_cache(cache_path, data)
+    return _freeze(data)
 
 
 def load_kanji_db() -> dict:
@@ -64,40 +142,64 @@ def load_wk_kanji_db() -> dict:
     return _load_or_download("wk_kanji_db", DB_URLS["wk_kanji_db"])
 
 
+def _iter_wk_subjects(url: str, api_key: str, session: requests.Session | None = None):
+    """Yield each subject from a paginated WK /subjects query, page by page.
+
+    Requests go through the shared session unless ``session`` is given.
+    """
+    session = session or _SESSION
+    headers = {"Authorization": f"Bearer {api_key}"}
+    while url:
+        resp = session.get(url, headers=headers, timeout=_TIMEOUT)
+        resp.raise_for_status()
+        payload = resp.json()
+        yield from payload["data"]
+        url = payload["pages"].get("next_url")
+
+
 def fetch_wk_radicals(api_key: str) -> dict:
     """Fetch all WK radicals and build a char->name mapping. Cached after first call."""
     ensure_cache_dir()
     cache_path = CACHE_DIR / "wk_radicals.json"
     if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
+        return _read_cache(cache_path)
 
     print("Fetching WaniKani radicals (one-time)...")
     radicals = {}  # character -> {"name": str, "level": int}
-    url = f"{WK_API_BASE}/subjects?types=radical"
-    headers = {"Authorization": f"Bearer {api_key}"}
+    for item in _iter_wk_subjects(f"{WK_API_BASE}/subjects?types=radical", api_key):
+        d = item["data"]
+        char = d.get("characters")
+        if char:  # some radicals are image-only
+            primary = next(
+                (m["meaning"] for m in d["meanings"] if m["primary"]),
+                d["meanings"][0]["meaning"] if d["meanings"] else None,
+            )
+            radicals[char] = {
+                "name": primary,
+                "level": d["level"],
+                "slug": d["slug"],
+            }
+
+    _write_cache(cache_path, radicals)
+    print(f"  Cached {len(radicals)} radicals.")
+    return _freeze(radicals)
 
-    while url:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-        for item in payload["data"]:
-            d = item["data"]
-            char = d.get("characters")
-            if char:  # some radicals are image-only
-                primary = next(
-                    (m["meaning"] for m in d["meanings"] if m["primary"]),
-                    d["meanings"][0]["meaning"] if d["meanings"] else None,
-                )
-                radicals[char] = {
-                    "name": primary,
-                    "level": d["level"],
-                    "slug": d["slug"],
-                }
-        url = payload["pages"].get("next_url")
 
-    cache_path.write_text(json.dumps(radicals, ensure_ascii=False), encoding="utf-8")
-    print(f"  Cached {len(radicals)} radicals.")
-    return radicals
+def _wk_radical_id_map(api_key: str, stop: threading.Event | None = None) -> dict:
+    """Map WK radical subject IDs to their characters, skipping image-only ones.
+
+    Runs on a worker thread, so it uses its own Session rather than the shared
+    one. Setting ``stop`` abandons the walk before the next page is requested.
+    """
+    id_map = {}
+    with _make_session() as session:
+        url = f"{WK_API_BASE}/subjects?types=radical"
+        for item in _iter_wk_subjects(url, api_key, session):
+            if stop is not None and stop.is_set():
+                break
+            if char := item["data"].get("characters"):
+                id_map[item["id"]] = char
+    return id_map
 
 
 def fetch_wk_kanji_subjects(api_key: str) -> dict:
@@ -105,41 +207,22 @@ def fetch_wk_kanji_subjects(api_key: str) -> dict:
     ensure_cache_dir()
     cache_path = CACHE_DIR / "wk_kanji_subjects.json"
     if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
+        return _read_cache(cache_path)
 
     print("Fetching WaniKani kanji subjects (one-time)...")
     kanji_map = {}  # character -> subject data
-    # Also need radical subjects for ID->char mapping
-    radical_id_map = {}  # subject_id -> character
-
-    # First pass: get radicals to build ID map
-    url = f"{WK_API_BASE}/subjects?types=radical"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    while url:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-        for item in payload["data"]:
-            char = item["data"].get("characters")
-            if char:
-                radical_id_map[item["id"]] = char
-        url = payload["pages"].get("next_url")
 
-    # Second pass: get kanji
-    url = f"{WK_API_BASE}/subjects?types=kanji"
-    while url:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-        for item in payload["data"]:
+    # The radical and kanji listings are independent paginated walks, so the
+    # radical ID map is built on a worker while kanji pages stream in here.
+    # Component IDs are stored as-is and resolved once both walks finish.
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    id_map_future = pool.submit(_wk_radical_id_map, api_key, stop)
+    try:
+        for item in _iter_wk_subjects(f"{WK_API_BASE}/subjects?types=kanji", api_key):
             d = item["data"]
             char = d.get("characters")
             if char:
-                # Resolve component radical IDs to characters
-                component_chars = []
-                for rid in d.get("component_subject_ids", []):
-                    if rid in radical_id_map:
-                        component_chars.append(radical_id_map[rid])
                 kanji_map[char] = {
                     "meanings": [m["meaning"] for m in d["meanings"]],
                     "readings": {
@@ -152,14 +235,69 @@ def fetch_wk_kanji_subjects(api_key: str) -> dict:
                             if r["type"] == "kunyomi"
                         ],
                     },
-                    "component_radicals": component_chars,
+                    "component_radicals": d.get("component_subject_ids", []),
                     "level": d["level"],
                 }
-        url = payload["pages"].get("next_url")
+        radical_id_map = id_map_future.result()
+    finally:
+        # If the kanji walk failed, report it now instead of waiting for the
+        # radical walk, which stops before its next page
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Resolve component radical IDs to characters (unknown IDs dropped)
+    for entry in kanji_map.values():
+        component_ids = entry["component_radicals"]
+        entry["component_radicals"] = list(
+            filter(None, map(radical_id_map.get, component_ids))
+        )
 
-    cache_path.write_text(json.dumps(kanji_map, ensure_ascii=False), encoding="utf-8")
+    _write_cache(cache_path, kanji_map)
     print(f"  Cached {len(kanji_map)} kanji subjects.")
-    return kanji_map
+    return _freeze(kanji_map)
+
+
+def _fetch_first_mirror(urls: list[str]) -> str | None:
+    """GET every mirror at once and return the first successful body to arrive.
+
+    A primary that fails or hangs costs nothing extra: whichever mirror answers
+    first with a usable body wins, and list order only breaks ties between
+    responses that are already in when the caller looks. Each request runs on
+    a daemon thread with its own Session, since requests doesn't promise that
+    one Session is safe to share across threads, and ones still in flight
+    after a body is chosen don't hold up interpreter exit.
+    """
+    done: queue.SimpleQueue = queue.SimpleQueue()
+
+    def fetch(i: int, url: str) -> None:
+        try:
+            with _make_session() as session:
+                done.put((i, session.get(url, timeout=_TIMEOUT)))
+        except Exception as exc:  # handed back to the calling thread below
+            done.put((i, exc))
+
+    for i, url in enumerate(urls):
+        threading.Thread(target=fetch, args=(i, url), daemon=True).start()
+
+    remaining = len(urls)
+    while remaining:
+        ready = [done.get()]
+        while not done.empty():
+            ready.append(done.get())
+        remaining -= len(ready)
+        for _, resp in sorted(ready, key=lambda outcome: outcome[0]):
+            if isinstance(resp, requests.RequestException):
+                continue
+            if isinstance(resp, Exception):
+                raise resp
+            if resp.ok:
+                try:
+                    # KRADFILE-u is UTF-8 by definition; resp.text would trust
+                    # the served charset (ISO-8859-1 for text/* without one)
+                    return resp.content.decode("utf-8")
+                except UnicodeDecodeError:
+                    continue
+    return None
 
 
 def load_kradfile() -> dict:
@@ -167,19 +305,10 @@ def load_kradfile() -> dict:
     ensure_cache_dir()
     cache_path = CACHE_DIR / "kradfile.json"
     if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
+        return _read_cache(cache_path)
 
     print("Downloading KRADFILE-u...")
-    text = None
-    for url in KRADFILE_URLS:
-        try:
-            resp = requests.get(url, timeout=30)
-            resp.raise_for_status()
-            text = resp.text
-            break
-        except requests.RequestException:
-            continue
-
+    text = _fetch_first_mirror(KRADFILE_URLS)
     if text is None:
         print("Warning: Could not download KRADFILE-u from any mirror.")
         return {}
@@ -195,9 +324,9 @@ def load_kradfile() -> dict:
         kanji, radicals = line.split(" : ", 1)
         kradfile[kanji.strip()] = radicals.strip().split()
 
-    cache_path.write_text(json.dumps(kradfile, ensure_ascii=False), encoding="utf-8")
+    _write_cache(cache_path, kradfile)
     print(f"  Cached {len(kradfile)} KRADFILE-u entries.")
-    return kradfile
+    return _freeze(kradfile)
 
 
 KANJIDIC_API_URL = (
@@ -205,10 +334,13 @@ KANJIDIC_API_URL = (
 )
 
 
+# Katakana block: U+30A1..U+30F6, offset from hiragana is 0x60
+_KATA_TO_HIRA = str.maketrans({c: c - 0x60 for c in range(0x30A1, 0x30F7)})
+
+
 def _katakana_to_hiragana(text: str) -> str:
     """Convert katakana characters to hiragana. Non-katakana passes through."""
-    # Katakana block: U+30A1..U+30F6, offset from hiragana is 0x60
-    return "".join(chr(ord(c) - 0x60) if "\u30a1" <= c <= "\u30f6" else c for c in text)
+    return text.translate(_KATA_TO_HIRA)
 
 
 def _parse_kanjidic(raw: dict) -> dict:
@@ -260,12 +392,12 @@ def load_kanjidic() -> dict:
     ensure_cache_dir()
     cache_path = CACHE_DIR / "kanjidic.json"
     if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
+        return _read_cache(cache_path)
 
     print("Downloading Kanjidic2 from jmdict-simplified...")
 
     # Find the kanjidic2-en tarball URL from the latest release
-    resp = requests.get(KANJIDIC_API_URL, timeout=30)
+    resp = _SESSION.get(KANJIDIC_API_URL, timeout=_TIMEOUT)
     resp.raise_for_status()
     release = resp.json()
 
@@ -283,7 +415,7 @@ def load_kanjidic() -> dict:
         )
 
     # Download and extract the tarball
-    resp = requests.get(tarball_url, timeout=120)
+    resp = _SESSION.get(tarball_url, timeout=(_TIMEOUT[0], 120))
     resp.raise_for_status()
 
     with tarfile.open(fileobj=io.BytesIO(resp.content), mode="r:gz") as tar:
@@ -297,9 +429,9 @@ def load_kanjidic() -> dict:
 
     result = _parse_kanjidic(raw)
 
-    cache_path.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+    _write_cache(cache_path, result)
     print(f"  Cached {len(result)} Kanjidic2 entries.")
-    return result
+    return _freeze(result)
 
 
 def load_personal_radicals() -> dict:
@@ -517,10 +649,16 @@ def save_mnemonic(kanji: str, mnemonic: str, model: str) -> None:
 
 
 def clear_cache():
-    """Remove all cached files."""
-    if CACHE_DIR.exists():
-        for f in CACHE_DIR.iterdir():
-            f.unlink()
-        print(f"Cache cleared: {CACHE_DIR}")
-    else:
+    """Remove the cached database files and any leftover write temp files.
+
+    CACHE_DIR can be pointed anywhere via KANJI_MNEMONIC_CACHE, so only files
+    this package writes are removed; other files, subdirectories, and the
+    directory itself (which may be a symlink) are left alone.
+    """
+    if not CACHE_DIR.exists():
         print("No cache to clear.")
+        return
+    for f in CACHE_DIR.iterdir():
+        if f.name.endswith((".json", ".json.tmp")) and f.is_file():
+            f.unlink()
+    print(f"Cache cleared: {CACHE_DIR}")
@@ -1,10 +1,50 @@
 """Look up a kanji across all databases and assemble a complete profile."""
 
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .data import _katakana_to_hiragana
 
 
+class RadicalNameIndex:
+    """Case-insensitive radical name -> char index over personal and WK radicals.
+
+    Built once per (wk_radicals, personal_radicals) pair so that repeated
+    queries, like resolving every part of a ``kanji decompose`` call, don't
+    rescan the radicals. Personal names take priority; among duplicates, the
+    first entry wins.
+    """
+
+    def __init__(self, wk_radicals: dict, personal_radicals: dict):
+        index: dict[str, str] = {}
+        for char, rad_name in personal_radicals.items():
+            index.setdefault(rad_name.lower(), char)
+        for char, info in wk_radicals.items():
+            index.setdefault(info["name"].lower(), char)
+        self._index = index
+        self._names = sorted(index)
+
+    def get(self, name: str) -> str | None:
+        """Return the character for a radical name, or None if not found."""
+        return self._index.get(name.lower())
+
+    def prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return (lowercase name, char) tuples whose name starts with ``prefix``.
+
+        Bisects the sorted names, so a query costs O(log N + k) for k matches.
+        """
+        prefix_lower = prefix.lower()
+        start = bisect_left(self._names, prefix_lower)
+        matches = []
+        for rad_name in self._names[start:]:
+            if not rad_name.startswith(prefix_lower):
+                break
+            matches.append((rad_name, self._index[rad_name]))
+        return matches
+
+
 def reverse_lookup_radical(
     name: str,
     wk_radicals: dict,
@@ -13,7 +53,8 @@ def reverse_lookup_radical(
     """Look up a radical character by its name (case-insensitive).
 
     Checks personal radicals first, then WK radicals.
-    Returns the character, or None if not found.
+    Returns the character, or None if not found. For many lookups against
+    the same radicals, build a ``RadicalNameIndex`` once instead.
     """
     name_lower = name.lower()
 
@@ -30,6 +71,28 @@ def reverse_lookup_radical(
     return None
 
 
+def reverse_lookup_radical_prefix(
+    prefix: str,
+    wk_radicals: dict,
+    personal_radicals: dict,
+) -> list[tuple[str, str]]:
+    """Find all radicals whose name starts with ``prefix`` (case-insensitive).
+
+    Returns a list of (lowercase name, char) tuples sorted by name, with the
+    same personal-over-WK priority as ``reverse_lookup_radical``. Only the
+    matches are sorted; for repeated queries, use ``RadicalNameIndex.prefix``.
+    """
+    prefix_lower = prefix.lower()
+    matches: dict[str, str] = {}
+    for char, rad_name in personal_radicals.items():
+        if (name_lower := rad_name.lower()).startswith(prefix_lower):
+            matches.setdefault(name_lower, char)
+    for char, info in wk_radicals.items():
+        if (name_lower := info["name"].lower()).startswith(prefix_lower):
+            matches.setdefault(name_lower, char)
+    return sorted(matches.items())
+
+
 @dataclass
 class KanjiProfile:
     character: str
@@ -79,6 +142,7 @@ def lookup_kanji(
     infer_phonetic: bool = True,
     personal_decompositions: dict | None = None,
     reading_overrides: dict | None = None,
+    reading_cache: dict[str, frozenset[str]] | None = None,
 ) -> KanjiProfile:
     profile = KanjiProfile(character=char)
 
@@ -106,9 +170,9 @@ def lookup_kanji(
             if not profile.wk_meaning:
                 profile.wk_meaning = subj["meanings"][0] if subj["meanings"] else None
             if not profile.onyomi:
-                profile.onyomi = subj["readings"].get("onyomi", [])
+                profile.onyomi = list(subj["readings"].get("onyomi", []))
             if not profile.kunyomi:
-                profile.kunyomi = subj["readings"].get("kunyomi", [])
+                profile.kunyomi = list(subj["readings"].get("kunyomi", []))
             if subj.get("level"):
                 profile.wk_level = subj["level"]
             # Map component radicals to names
@@ -126,9 +190,9 @@ def lookup_kanji(
             if not profile.wk_meaning and kd.get("meanings"):
                 profile.wk_meaning = kd["meanings"][0]
             if not profile.onyomi and kd.get("onyomi"):
-                profile.onyomi = kd["onyomi"]
+                profile.onyomi = list(kd["onyomi"])
             if not profile.kunyomi and kd.get("kunyomi"):
-                profile.kunyomi = kd["kunyomi"]
+                profile.kunyomi = list(kd["kunyomi"])
             if kd.get("grade") is not None:
                 profile.joyo_grade = kd["grade"]
             if kd.get("frequency") is not None:
@@ -137,6 +201,12 @@ def lookup_kanji(
     # Track which component chars we've already added to wk_components
     existing_chars = {c["char"] for c in profile.wk_components}
 
+    # Reading sets computed during KRADFILE scans, shared between the subset
+    # inference and synthetic phonetic family passes. Callers looking up many
+    # kanji against the same databases can pass one cache for all of them.
+    if reading_cache is None:
+        reading_cache = {}
+
     # --- Keisei kanji DB ---
     keisei = kanji_db.get(char)
     if keisei:
@@ -147,18 +217,18 @@ def lookup_kanji(
             profile.keisei_type = keisei_type
             profile.semantic_component = keisei.get("semantic")
             profile.phonetic_component = keisei.get("phonetic")
-            profile.decomposition = keisei.get("decomposition", [])
+            profile.decomposition = list(keisei.get("decomposition", []))
             profile.decomposition_source = "keisei"
 
             # If readings weren't found in WK data, use Keisei readings
             if not profile.onyomi and keisei.get("readings"):
-                profile.onyomi = keisei["readings"]
+                profile.onyomi = list(keisei["readings"])
 
     # --- KRADFILE-u fallback (non-WK kanji or type-only keisei entries) ---
     if kradfile and (not keisei or not profile.decomposition):
         krad_components = kradfile.get(char, [])
         if krad_components:
-            profile.decomposition = krad_components
+            profile.decomposition = list(krad_components)
             if not profile.decomposition_source:
                 profile.decomposition_source = "kradfile"
             # Resolve component names from WK radicals
@@ -174,7 +244,12 @@ def lookup_kanji(
             # Fallback: KRADFILE subset matching when phonetic_db has no match
             if infer_phonetic and not profile.phonetic_component:
                 detected = _infer_phonetic_from_kradfile_subsets(
-                    profile, krad_components, kradfile, kanjidic, wk_kanji_db
+                    profile,
+                    krad_components,
+                    kradfile,
+                    kanjidic,
+                    wk_kanji_db,
+                    reading_cache,
                 )
                 if detected:
                     phonetic_krad = kradfile.get(detected, [])
@@ -209,11 +284,11 @@ def lookup_kanji(
                 ph_display_name = wk_entry.get("meaning")
         profile.phonetic_family = {
             "phonetic_char": phonetic_char,
-            "readings": ph.get("readings", []),
+            "readings": list(ph.get("readings", [])),
             "wk_radical_name": ph_display_name,
-            "compounds": ph.get("compounds", []),
-            "non_compounds": ph.get("non_compounds", []),
-            "xrefs": ph.get("xrefs", []),
+            "compounds": list(ph.get("compounds", [])),
+            "non_compounds": list(ph.get("non_compounds", [])),
+            "xrefs": list(ph.get("xrefs", [])),
         }
         # Enrich compounds with their meanings from wk_kanji_db
         for compound_char in ph.get("compounds", []):
@@ -231,22 +306,11 @@ def lookup_kanji(
         # Get the phonetic component's readings (on'yomi + kun'yomi stems)
         phonetic_readings: list[str] = []
         if keisei and keisei.get("readings"):
-            phonetic_readings = keisei["readings"]
+            phonetic_readings = list(keisei["readings"])
         else:
             wk_entry = wk_kanji_db.get(phonetic_char)
             if wk_entry:
-                if wk_entry.get("onyomi"):
-                    phonetic_readings.extend(
-                        _katakana_to_hiragana(r.strip())
-                        for r in wk_entry["onyomi"].split(",")
-                        if r.strip()
-                    )
-                if wk_entry.get("kunyomi"):
-                    phonetic_readings.extend(
-                        _kun_stem(r.strip())
-                        for r in wk_entry["kunyomi"].split(",")
-                        if r.strip()
-                    )
+                phonetic_readings.extend(_wk_entry_readings(wk_entry))
             if not phonetic_readings and kanjidic:
                 kd = kanjidic.get(phonetic_char, {})
                 if kd.get("onyomi"):
@@ -257,13 +321,7 @@ def lookup_kanji(
         # Get the phonetic component's meaning for display
         phonetic_name = rad_info["name"] if rad_info else None
         if not phonetic_name:
-            wk_entry = wk_kanji_db.get(phonetic_char)
-            if wk_entry:
-                phonetic_name = wk_entry.get("meaning")
-            elif kanjidic:
-                kd = kanjidic.get(phonetic_char, {})
-                if kd.get("meanings"):
-                    phonetic_name = kd["meanings"][0]
+            phonetic_name = _kanji_meaning(phonetic_char, wk_kanji_db, kanjidic)
 
         # Scan KRADFILE for other kanji sharing this phonetic component
         synthetic_compounds: list[str] = []
@@ -278,27 +336,9 @@ def lookup_kanji(
                 if not ph_set.issubset(set(k_components)):
                     continue
                 # Check reading overlap (on'yomi + kun'yomi)
-                k_readings: set[str] = set()
-                wk_c = wk_kanji_db.get(k_char)
-                if wk_c:
-                    if wk_c.get("onyomi"):
-                        k_readings.update(
-                            _katakana_to_hiragana(r.strip())
-                            for r in wk_c["onyomi"].split(",")
-                            if r.strip()
-                        )
-                    if wk_c.get("kunyomi"):
-                        k_readings.update(
-                            _kun_stem(r.strip())
-                            for r in wk_c["kunyomi"].split(",")
-                            if r.strip()
-                        )
-                if kanjidic:
-                    kd_c = kanjidic.get(k_char, {})
-                    if kd_c.get("onyomi"):
-                        k_readings.update(kd_c["onyomi"])
-                    if kd_c.get("kunyomi"):
-                        k_readings.update(_kun_stem(r) for r in kd_c["kunyomi"])
+                k_readings = _kanji_readings(
+                    k_char, wk_kanji_db, kanjidic, reading_cache
+                )
                 if ph_reading_set & k_readings:
                     synthetic_compounds.append(k_char)
 
@@ -313,7 +353,7 @@ def lookup_kanji(
 
         # Enrich synthetic compounds with meanings
         for compound_char in synthetic_compounds:
-            entry: dict = {"char": compound_char}
+            entry = {"char": compound_char}
             wk_c = wk_kanji_db.get(compound_char)
             if wk_c:
                 entry["meaning"] = wk_c.get("meaning")
@@ -374,7 +414,7 @@ def lookup_kanji(
         profile.decomposition_source = "personal"
 
         # Override decomposition
-        profile.decomposition = pd["parts"]
+        profile.decomposition = list(pd["parts"])
         parts_set = set(pd["parts"])
 
         # Inherit auto-detected PS components if not explicitly set
@@ -409,13 +449,7 @@ def lookup_kanji(
                 if ph_entry.get("wk-radical"):
                     name = ph_entry["wk-radical"]
             if not name:
-                wk_entry = wk_kanji_db.get(part_char)
-                if wk_entry:
-                    name = wk_entry.get("meaning")
-            if not name and kanjidic:
-                kd = kanjidic.get(part_char, {})
-                if kd.get("meanings"):
-                    name = kd["meanings"][0]
+                name = _kanji_meaning(part_char, wk_kanji_db, kanjidic)
             profile.wk_components.append({"char": part_char, "name": name})
 
         # Rebuild phonetic family if phonetic component changed
@@ -434,11 +468,11 @@ def lookup_kanji(
                         ph_display_name = wk_entry.get("meaning")
                 profile.phonetic_family = {
                     "phonetic_char": new_phonetic,
-                    "readings": ph.get("readings", []),
+                    "readings": list(ph.get("readings", [])),
                     "wk_radical_name": ph_display_name,
-                    "compounds": ph.get("compounds", []),
-                    "non_compounds": ph.get("non_compounds", []),
-                    "xrefs": ph.get("xrefs", []),
+                    "compounds": list(ph.get("compounds", [])),
+                    "non_compounds": list(ph.get("non_compounds", [])),
+                    "xrefs": list(ph.get("xrefs", [])),
                 }
                 # Enrich compounds
                 profile.phonetic_family_kanji_details = []
@@ -470,6 +504,84 @@ def lookup_kanji(
     return profile
 
 
+def make_kanji_lookup(
+    kanji_db: dict,
+    phonetic_db: dict,
+    wk_kanji_db: dict,
+    wk_radicals: dict,
+    wk_kanji_subjects: dict | None = None,
+    kradfile: dict | None = None,
+    kanjidic: dict | None = None,
+    personal_radicals: dict | None = None,
+    infer_phonetic: bool = True,
+    personal_decompositions: dict | None = None,
+    reading_overrides: dict | None = None,
+) -> Callable[[str], KanjiProfile]:
+    """Bind the databases once and return a single-argument lookup function.
+
+    The returned function gives the same result as ``lookup_kanji(char, ...)``
+    with the same arguments, but keeps one reading cache for its whole
+    lifetime, so candidate kanji seen by an earlier lookup's KRADFILE scans
+    aren't re-derived by later ones. The databases must not change while the
+    function is in use.
+    """
+    reading_cache: dict[str, frozenset[str]] = {}
+
+    def lookup(char: str) -> KanjiProfile:
+        return lookup_kanji(
+            char,
+            kanji_db,
+            phonetic_db,
+            wk_kanji_db,
+            wk_radicals,
+            wk_kanji_subjects,
+            kradfile,
+            kanjidic,
+            personal_radicals=personal_radicals,
+            infer_phonetic=infer_phonetic,
+            personal_decompositions=personal_decompositions,
+            reading_overrides=reading_overrides,
+            reading_cache=reading_cache,
+        )
+
+    return lookup
+
+
+def lookup_kanji_many(
+    chars: Iterable[str],
+    kanji_db: dict,
+    phonetic_db: dict,
+    wk_kanji_db: dict,
+    wk_radicals: dict,
+    wk_kanji_subjects: dict | None = None,
+    kradfile: dict | None = None,
+    kanjidic: dict | None = None,
+    personal_radicals: dict | None = None,
+    infer_phonetic: bool = True,
+    personal_decompositions: dict | None = None,
+    reading_overrides: dict | None = None,
+) -> list[KanjiProfile]:
+    """Look up several kanji against the same databases, in order.
+
+    One reading cache is shared across the batch, so the KRADFILE scans only
+    compute each candidate kanji's readings once rather than once per lookup.
+    """
+    lookup = make_kanji_lookup(
+        kanji_db,
+        phonetic_db,
+        wk_kanji_db,
+        wk_radicals,
+        wk_kanji_subjects,
+        kradfile,
+        kanjidic,
+        personal_radicals=personal_radicals,
+        infer_phonetic=infer_phonetic,
+        personal_decompositions=personal_decompositions,
+        reading_overrides=reading_overrides,
+    )
+    return [lookup(char) for char in chars]
+
+
 def _infer_phonetic_semantic(
     profile: KanjiProfile,
     components: list[str],
@@ -509,12 +621,75 @@ def _kun_stem(reading: str) -> str:
     return reading.split(".")[0]
 
 
+@lru_cache(maxsize=16384)
+def _parse_wk_readings(onyomi: str, kunyomi: str) -> tuple[str, ...]:
+    """Parse Keisei's comma-separated reading fields into comparable readings.
+
+    On'yomi are converted to hiragana and kun'yomi are reduced to their stems,
+    on'yomi first.  Cached on the raw strings, since the KRADFILE scans parse
+    the same wk_kanji_db entries over and over.
+    """
+    readings = [
+        _katakana_to_hiragana(r.strip()) for r in onyomi.split(",") if r.strip()
+    ]
+    readings.extend(_kun_stem(r.strip()) for r in kunyomi.split(",") if r.strip())
+    return tuple(readings)
+
+
+def _wk_entry_readings(wk_entry: dict) -> tuple[str, ...]:
+    """Return the parsed on'yomi + kun'yomi stems of a wk_kanji_db entry."""
+    return _parse_wk_readings(
+        wk_entry.get("onyomi") or "", wk_entry.get("kunyomi") or ""
+    )
+
+
+def _kanji_readings(
+    char: str,
+    wk_kanji_db: dict,
+    kanjidic: dict | None,
+    cache: dict[str, frozenset[str]] | None = None,
+) -> frozenset[str]:
+    """Return a kanji's on'yomi (hiragana) + kun'yomi stems from all sources.
+
+    When ``cache`` is given, results are memoized in it by character.
+    """
+    if cache is not None and char in cache:
+        return cache[char]
+    readings: set[str] = set()
+    wk_entry = wk_kanji_db.get(char)
+    if wk_entry:
+        readings.update(_wk_entry_readings(wk_entry))
+    if kanjidic:
+        kd = kanjidic.get(char, {})
+        if kd.get("onyomi"):
+            readings.update(kd["onyomi"])  # already hiragana
+        if kd.get("kunyomi"):
+            readings.update(_kun_stem(r) for r in kd["kunyomi"])
+    result = frozenset(readings)
+    if cache is not None:
+        cache[char] = result
+    return result
+
+
+def _kanji_meaning(char: str, wk_kanji_db: dict, kanjidic: dict | None) -> str | None:
+    """Return a kanji's display meaning: wk_kanji_db first, then Kanjidic."""
+    wk_entry = wk_kanji_db.get(char)
+    if wk_entry and wk_entry.get("meaning"):
+        return wk_entry["meaning"]
+    if kanjidic:
+        kd = kanjidic.get(char, {})
+        if kd.get("meanings"):
+            return kd["meanings"][0]
+    return None
+
+
 def _infer_phonetic_from_kradfile_subsets(
     profile: KanjiProfile,
     target_components: list[str],
     kradfile: dict,
     kanjidic: dict | None,
     wk_kanji_db: dict,
+    reading_cache: dict[str, frozenset[str]] | None = None,
 ) -> str | None:
     """Fallback: find kanji whose KRADFILE components are a subset with shared reading.
 
@@ -522,6 +697,9 @@ def _infer_phonetic_from_kradfile_subsets(
     subset of ``target_components`` AND shares an on'yomi or kun'yomi reading
     with the target. Returns the detected phonetic component character, or
     ``None``.
+
+    ``reading_cache`` lets the caller share candidate reading sets with the
+    later synthetic-family scan over the same KRADFILE.
     """
     target_set = set(target_components)
     if len(target_set) < 2:
@@ -550,27 +728,7 @@ def _infer_phonetic_from_kradfile_subsets(
             continue
 
         # Get candidate's readings (on'yomi + kun'yomi)
-        cand_readings: set[str] = set()
-        wk_entry = wk_kanji_db.get(cand_char)
-        if wk_entry:
-            if wk_entry.get("onyomi"):
-                cand_readings.update(
-                    _katakana_to_hiragana(r.strip())
-                    for r in wk_entry["onyomi"].split(",")
-                    if r.strip()
-                )
-            if wk_entry.get("kunyomi"):
-                cand_readings.update(
-                    _kun_stem(r.strip())
-                    for r in wk_entry["kunyomi"].split(",")
-                    if r.strip()
-                )
-        if kanjidic:
-            kd = kanjidic.get(cand_char, {})
-            if kd.get("onyomi"):
-                cand_readings.update(kd["onyomi"])  # already hiragana
-            if kd.get("kunyomi"):
-                cand_readings.update(_kun_stem(r) for r in kd["kunyomi"])
+        cand_readings = _kanji_readings(cand_char, wk_kanji_db, kanjidic, reading_cache)
 
         if not (target_readings & cand_readings):
             continue
@@ -611,24 +769,6 @@ def _replace_atoms_with_phonetic_components(
     """
     phonetic_atoms = set(phonetic_krad_components)
 
-    # Find the index of the first atom belonging to the phonetic component
-    insert_idx = None
-    for i, comp in enumerate(profile.wk_components):
-        if comp["char"] in phonetic_atoms:
-            if insert_idx is None:
-                insert_idx = i
-
-    # Remove the phonetic component's atoms
-    profile.wk_components = [
-        c for c in profile.wk_components if c["char"] not in phonetic_atoms
-    ]
-
-    if insert_idx is None:
-        insert_idx = len(profile.wk_components)
-    else:
-        # Adjust index for removals before insert_idx
-        insert_idx = min(insert_idx, len(profile.wk_components))
-
     # Get replacement components from WK kanji subject if available
     new_components: list[dict] = []
     subj = wk_kanji_subjects.get(phonetic_char) if wk_kanji_subjects else None
@@ -639,19 +779,23 @@ def _replace_atoms_with_phonetic_components(
             new_components.append({"char": rc, "name": name})
     else:
         # No WK subject — insert the phonetic component itself with its meaning
-        name = None
-        wk_entry = wk_kanji_db.get(phonetic_char)
-        if wk_entry:
-            name = wk_entry.get("meaning")
-        elif kanjidic:
-            kd = kanjidic.get(phonetic_char, {})
-            if kd.get("meanings"):
-                name = kd["meanings"][0]
+        name = _kanji_meaning(phonetic_char, wk_kanji_db, kanjidic)
         new_components.append({"char": phonetic_char, "name": name})
 
-    # Insert at the position where the first atom was
-    for i, comp in enumerate(new_components):
-        profile.wk_components.insert(insert_idx + i, comp)
+    # Drop the phonetic component's atoms and put the replacements where
+    # the first atom was (or at the end if none were present), in one pass
+    out: list[dict] = []
+    inserted = False
+    for comp in profile.wk_components:
+        if comp["char"] in phonetic_atoms:
+            if not inserted:
+                out.extend(new_components)
+                inserted = True
+            continue
+        out.append(comp)
+    if not inserted:
+        out.extend(new_components)
+    profile.wk_components = out
 
     # Update decomposition to use the new radical chars instead of atoms
     new_decomp = [c for c in profile.decomposition if c not in phonetic_atoms]
@@ -661,10 +805,43 @@ def _replace_atoms_with_phonetic_components(
     profile.decomposition = new_decomp
 
 
+# Display labels for keisei types, shared by every format_profile call
+_TYPE_LABELS = {
+    "comp_phonetic": "Phonetic-Semantic Compound (形声)",
+    "comp_phonetic_inferred": "Phonetic-Semantic Compound (形声) [inferred from KRADFILE]",
+    "comp_indicative": "Compound Indicative (会意)",
+    "hieroglyph": "Hieroglyph / Pictograph (象形)",
+    "indicative": "Simple Indicative (指事)",
+    "unknown": "Unknown origin",
+}
+_AUTO_TYPE_LABELS = {
+    **_TYPE_LABELS,
+    "comp_phonetic_inferred": "Phonetic-Semantic Compound (形声) [inferred]",
+}
+
+
 def format_profile(profile: KanjiProfile, *, show_all_decomp: bool = False) -> str:
     """Format the profile as a human-readable summary (also used as LLM context)."""
-    lines = []
-    lines.append(f"═══ {profile.character} ═══")
+    is_personal = profile.personal_decomposition is not None
+    sections = [
+        _fmt_header(profile),
+        _fmt_keisei_type(profile),
+        _fmt_wk_components(profile, is_personal),
+        _fmt_phonetic_breakdown(profile, is_personal),
+        _fmt_phonetic_family(profile),
+        _fmt_decomposition(profile),
+        # --- All-decomp mode: show auto-detected decomposition as separate section ---
+        _fmt_auto_decomp(profile) if show_all_decomp and is_personal else None,
+    ]
+    return "\n".join(filter(None, sections))
+
+
+# Each section helper returns its lines already joined, or None when the
+# section is empty.  A leading "\n" renders as a blank separator line.
+
+
+def _fmt_header(profile: KanjiProfile) -> str:
+    lines = [f"═══ {profile.character} ═══"]
     if profile.wk_meaning:
         lines.append(f"Meaning: {profile.wk_meaning}")
     if profile.wk_level:
@@ -679,114 +856,112 @@ def format_profile(profile: KanjiProfile, *, show_all_decomp: bool = False) -> s
         lines.append(f"Joyo Grade: {profile.joyo_grade}")
     if profile.frequency_rank is not None:
         lines.append(f"Frequency Rank: {profile.frequency_rank}")
-
     lines.append("")
+    return "\n".join(lines)
 
-    if profile.keisei_type:
-        type_labels = {
-            "comp_phonetic": "Phonetic-Semantic Compound (形声)",
-            "comp_phonetic_inferred": "Phonetic-Semantic Compound (形声) [inferred from KRADFILE]",
-            "comp_indicative": "Compound Indicative (会意)",
-            "hieroglyph": "Hieroglyph / Pictograph (象形)",
-            "indicative": "Simple Indicative (指事)",
-            "unknown": "Unknown origin",
-        }
-        lines.append(
-            f"Type: {type_labels.get(profile.keisei_type, profile.keisei_type)}"
-        )
 
-    is_personal = profile.personal_decomposition is not None
+def _fmt_keisei_type(profile: KanjiProfile) -> str | None:
+    if not profile.keisei_type:
+        return None
+    return f"Type: {_TYPE_LABELS.get(profile.keisei_type, profile.keisei_type)}"
 
-    if profile.wk_components:
-        header = "WaniKani Components"
-        if is_personal:
-            header += " [personal]"
-        lines.append(f"{header}:")
-        for c in profile.wk_components:
-            if c["name"]:
-                lines.append(f"  {c['char']} → {c['name']}")
-            else:
-                lines.append(
-                    f"  {c['char']} → (no name — use kanji name {c['char']} <name> to add one)"
-                )
 
-    if profile.keisei_type in ("comp_phonetic", "comp_phonetic_inferred"):
-        lines.append("")
-        header = "── Phonetic-Semantic Breakdown"
-        if is_personal:
-            header += " [personal]"
-        header += " ──"
-        lines.append(header)
-        sem = profile.semantic_component or "?"
-        ph = profile.phonetic_component or "?"
-        sem_name = _find_name(sem, profile.wk_components)
-        # For phonetic component, fall back to phonetic_family name (covers
-        # cases where the phonetic is a kanji whose sub-radicals replaced it
-        # in wk_components, e.g. 追 replaced by Bear + Scooter).
-        ph_name = _find_name(ph, profile.wk_components, allow_missing=True)
-        if ph_name is None and profile.phonetic_family:
-            ph_name = profile.phonetic_family.get("wk_radical_name")
-        if ph_name is None:
-            ph_name = f"(no name — use kanji name {ph} <name> to add one)"
-        lines.append(f"  Semantic (meaning hint): {sem} ({sem_name})")
-        lines.append(f"  Phonetic (reading hint):  {ph} ({ph_name})")
-
-    if profile.phonetic_family:
-        pf = profile.phonetic_family
-        lines.append("")
-        lines.append("── Phonetic Family ──")
-        ph_name = pf.get("wk_radical_name") or "(no name)"
-        lines.append(f"  Phonetic component: {pf['phonetic_char']} ({ph_name})")
-        lines.append(f"  Family readings: {', '.join(pf['readings'])}")
-        if profile.phonetic_family_kanji_details:
-            lines.append("  Other kanji in this family:")
-            for entry in profile.phonetic_family_kanji_details:
-                if entry["char"] == profile.character:
-                    continue
-                meaning = entry.get("meaning", "?")
-                reading = entry.get("onyomi", "?")
-                lines.append(f"    {entry['char']} — {meaning} ({reading})")
-        if pf.get("non_compounds"):
-            lines.append(
-                f"  ⚠ Looks similar but different reading: {', '.join(pf['non_compounds'])}"
-            )
-
-    if profile.decomposition and profile.keisei_type not in (
+def _fmt_wk_components(profile: KanjiProfile, is_personal: bool) -> str | None:
+    if not profile.wk_components:
+        return None
+    header = "WaniKani Components"
+    if is_personal:
+        header += " [personal]"
+    rows = [
+        f"  {c['char']} → {c['name']}"
+        if c["name"]
+        else f"  {c['char']} → (no name — use kanji name {c['char']} <name> to add one)"
+        for c in profile.wk_components
+    ]
+    return f"{header}:\n" + "\n".join(rows)
+
+
+def _fmt_phonetic_breakdown(profile: KanjiProfile, is_personal: bool) -> str | None:
+    if profile.keisei_type not in ("comp_phonetic", "comp_phonetic_inferred"):
+        return None
+    header = "── Phonetic-Semantic Breakdown"
+    if is_personal:
+        header += " [personal]"
+    sem = profile.semantic_component or "?"
+    ph = profile.phonetic_component or "?"
+    sem_name = _find_name(sem, profile.wk_components)
+    # For phonetic component, fall back to phonetic_family name (covers
+    # cases where the phonetic is a kanji whose sub-radicals replaced it
+    # in wk_components, e.g. 追 replaced by Bear + Scooter).
+    ph_name = _find_name(ph, profile.wk_components, allow_missing=True)
+    if ph_name is None and profile.phonetic_family:
+        ph_name = profile.phonetic_family.get("wk_radical_name")
+    if ph_name is None:
+        ph_name = f"(no name — use kanji name {ph} <name> to add one)"
+    return (
+        f"\n{header} ──\n"
+        f"  Semantic (meaning hint): {sem} ({sem_name})\n"
+        f"  Phonetic (reading hint):  {ph} ({ph_name})"
+    )
+
+
+def _fmt_phonetic_family(profile: KanjiProfile) -> str | None:
+    pf = profile.phonetic_family
+    if not pf:
+        return None
+    ph_name = pf.get("wk_radical_name") or "(no name)"
+    out = (
+        "\n── Phonetic Family ──\n"
+        f"  Phonetic component: {pf['phonetic_char']} ({ph_name})\n"
+        f"  Family readings: {', '.join(pf['readings'])}"
+    )
+    if profile.phonetic_family_kanji_details:
+        rows = [
+            f"    {entry['char']} — {entry.get('meaning', '?')} ({entry.get('onyomi', '?')})"
+            for entry in profile.phonetic_family_kanji_details
+            if entry["char"] != profile.character
+        ]
+        out += "\n  Other kanji in this family:"
+        if rows:
+            out += "\n" + "\n".join(rows)
+    if pf.get("non_compounds"):
+        out += (
+            "\n  ⚠ Looks similar but different reading: "
+            f"{', '.join(pf['non_compounds'])}"
+        )
+    return out
+
+
+def _fmt_decomposition(profile: KanjiProfile) -> str | None:
+    if not profile.decomposition or profile.keisei_type in (
         "comp_phonetic",
         "comp_phonetic_inferred",
     ):
-        lines.append("")
-        lines.append("Decomposition: " + " + ".join(profile.decomposition))
-
-    # --- All-decomp mode: show auto-detected decomposition as separate section ---
-    if show_all_decomp and is_personal and profile.auto_wk_components:
-        lines.append("")
-        lines.append("── Auto-detected Decomposition ──")
-        if profile.auto_keisei_type:
-            auto_type_labels = {
-                "comp_phonetic": "Phonetic-Semantic Compound (形声)",
-                "comp_phonetic_inferred": "Phonetic-Semantic Compound (形声) [inferred]",
-                "comp_indicative": "Compound Indicative (会意)",
-                "hieroglyph": "Hieroglyph / Pictograph (象形)",
-                "indicative": "Simple Indicative (指事)",
-                "unknown": "Unknown origin",
-            }
-            lines.append(
-                f"  Type: {auto_type_labels.get(profile.auto_keisei_type, profile.auto_keisei_type)}"
-            )
-        lines.append("  Components:")
-        for c in profile.auto_wk_components:
-            name = c["name"] or "(no name)"
-            lines.append(f"    {c['char']} → {name}")
-        if profile.auto_semantic_component or profile.auto_phonetic_component:
-            if profile.auto_semantic_component:
-                lines.append(f"  Semantic: {profile.auto_semantic_component}")
-            if profile.auto_phonetic_component:
-                lines.append(f"  Phonetic: {profile.auto_phonetic_component}")
-        if profile.auto_decomposition:
-            lines.append("  Decomposition: " + " + ".join(profile.auto_decomposition))
+        return None
+    return "\nDecomposition: " + " + ".join(profile.decomposition)
 
-    return "\n".join(lines)
+
+def _fmt_auto_decomp(profile: KanjiProfile) -> str | None:
+    if not profile.auto_wk_components:
+        return None
+    out = "\n── Auto-detected Decomposition ──"
+    if profile.auto_keisei_type:
+        label = _AUTO_TYPE_LABELS.get(
+            profile.auto_keisei_type, profile.auto_keisei_type
+        )
+        out += f"\n  Type: {label}"
+    rows = "\n".join(
+        f"    {c['char']} → {c['name'] or '(no name)'}"
+        for c in profile.auto_wk_components
+    )
+    out += f"\n  Components:\n{rows}"
+    if profile.auto_semantic_component:
+        out += f"\n  Semantic: {profile.auto_semantic_component}"
+    if profile.auto_phonetic_component:
+        out += f"\n  Phonetic: {profile.auto_phonetic_component}"
+    if profile.auto_decomposition:
+        out += f"\n  Decomposition: {' + '.join(profile.auto_decomposition)}"
+    return out
 
 
 def _find_name(
@@ -50,22 +50,16 @@ def _get_relevant_sound_mnemonics(profile: KanjiProfile, sound_mnemonics: dict)
     When ``profile.important_reading`` is set (``"onyomi"`` or ``"kunyomi"``),
     only returns sound mnemonics for that reading type.
     """
-    relevant = {}
-    include_onyomi = profile.important_reading in (None, "onyomi")
-    include_kunyomi = profile.important_reading in (None, "kunyomi")
-
-    if include_onyomi:
-        for reading in profile.onyomi:
-            hiragana = _katakana_to_hiragana(reading)
-            if hiragana in sound_mnemonics:
-                relevant[hiragana] = sound_mnemonics[hiragana]
-    if include_kunyomi:
-        for reading in profile.kunyomi:
-            # Strip okurigana: "かた.る" -> "かた"
-            stem = reading.split(".")[0]
-            if stem in sound_mnemonics:
-                relevant[stem] = sound_mnemonics[stem]
-    return relevant
+    candidates: list[str] = []
+    if profile.important_reading in (None, "onyomi"):
+        candidates.extend(_katakana_to_hiragana(r) for r in profile.onyomi)
+    if profile.important_reading in (None, "kunyomi"):
+        # Strip okurigana: "かた.る" -> "かた"
+        candidates.extend(r.split(".", 1)[0] for r in profile.kunyomi)
+    # dict.fromkeys de-duplicates while keeping reading order for the prompt
+    return {
+        r: sound_mnemonics[r] for r in dict.fromkeys(candidates) if r in sound_mnemonics
+    }
 
 
 def build_prompt(
@@ -74,40 +68,38 @@ def build_prompt(
     sound_mnemonics: dict | None = None,
 ) -> str:
     """Build the user message for mnemonic generation."""
-    parts = []
-
-    parts.append("Generate a mnemonic for this kanji:\n")
-    parts.append(format_profile(profile))
-
+    # Only the optional blocks vary; each carries its own leading newlines
+    sound_block = ""
     if sound_mnemonics:
         relevant = _get_relevant_sound_mnemonics(profile, sound_mnemonics)
         if relevant:
-            parts.append("\n── Sound mnemonic characters for this kanji ──")
-            for reading, info in relevant.items():
-                parts.append(
-                    f"  {reading} → {info['character']} ({info['description']})"
-                )
-
-    if user_context:
-        parts.append(f"\n── Additional context from user ──\n{user_context}")
-
-    parts.append("\n── Please generate ──")
-    parts.append(
-        "1. **Meaning mnemonic**: A short story connecting the WK radical names to the meaning"
-    )
-    parts.append(
-        "2. **Reading mnemonic**: A story/hook for remembering the primary reading"
+            rows = "".join(
+                f"\n  {reading} → {info['character']} ({info['description']})"
+                for reading, info in relevant.items()
+            )
+            sound_block = f"\n\n── Sound mnemonic characters for this kanji ──{rows}"
+
+    user_block = (
+        f"\n\n── Additional context from user ──\n{user_context}"
+        if user_context
+        else ""
     )
 
+    family_block = ""
     if (
         profile.keisei_type in ("comp_phonetic", "comp_phonetic_inferred")
         and profile.phonetic_family
     ):
-        parts.append(
-            "3. **Phonetic family note**: A brief note about the phonetic pattern to reinforce"
-        )
+        family_block = "\n3. **Phonetic family note**: A brief note about the phonetic pattern to reinforce"
 
-    return "\n".join(parts)
+    return (
+        "Generate a mnemonic for this kanji:\n\n"
+        f"{format_profile(profile)}{sound_block}{user_block}\n"
+        "\n── Please generate ──\n"
+        "1. **Meaning mnemonic**: A short story connecting the WK radical names to the meaning\n"
+        "2. **Reading mnemonic**: A story/hook for remembering the primary reading"
+        f"{family_block}"
+    )
 
 
 def get_system_prompt() -> str:
@@ -0,0 +1,129 @@
+"""Helpers shared by the WK sound mnemonic scripts.
+
+Fetches kanji reading mnemonics from the WaniKani API and tallies the
+reading -> character name associations found in them. Like the scripts that
+import it, this module is not installed and not tested by CI; running either
+script puts this directory on sys.path, so a plain import finds it.
+"""
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from kanji_mnemonic.data import _katakana_to_hiragana
+
+WK_API_BASE = "https://api.wanikani.com/v2"
+WK_MAX_LEVEL = 60
+WK_LEVEL_CHUNK = 10
+
+
+def _fetch_subject_pages(session: requests.Session, url: str) -> list[dict]:
+    """Follow next_url links from url and return every subject on the way."""
+    subjects = []
+    while url:
+        resp = session.get(url, timeout=30)
+        resp.raise_for_status()
+        payload = resp.json()
+        subjects.extend(payload["data"])
+        url = payload["pages"].get("next_url")
+    return subjects
+
+
+def fetch_kanji_reading_mnemonics(api_key: str) -> list[dict]:
+    """Fetch all kanji subjects with reading_mnemonic fields.
+
+    WK paginates with an opaque page_after_id cursor, so the query is split
+    into level ranges that are paged through concurrently on one keep-alive
+    session.  Subjects are re-sorted by id to match a single serial fetch.
+    """
+    level_ranges = [
+        range(lo, min(lo + WK_LEVEL_CHUNK, WK_MAX_LEVEL + 1))
+        for lo in range(1, WK_MAX_LEVEL + 1, WK_LEVEL_CHUNK)
+    ]
+    urls = [
+        f"{WK_API_BASE}/subjects?types=kanji&levels={','.join(map(str, levels))}"
+        for levels in level_ranges
+    ]
+
+    print(f"  Fetching kanji subjects ({len(urls)} level ranges in parallel)...")
+    with requests.Session() as session:
+        session.headers.update({"Authorization": f"Bearer {api_key}"})
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            pages = list(pool.map(lambda u: _fetch_subject_pages(session, u), urls))
+    subjects = sorted((s for chunk in pages for s in chunk), key=lambda s: s["id"])
+
+    results = []
+    for item in subjects:
+        d = item["data"]
+        rm = d.get("reading_mnemonic", "")
+        if rm:
+            results.append(
+                {
+                    "characters": d.get("characters", ""),
+                    "readings": {
+                        r["reading"]: r["type"] for r in d.get("readings", [])
+                    },
+                    "primary": [
+                        r["reading"] for r in d.get("readings", []) if r["primary"]
+                    ],
+                    "reading_mnemonic": rm,
+                }
+            )
+
+    print(f"  Fetched {len(results)} kanji with reading mnemonics.    ")
+    return results
+
+
+# Both WK patterns share the <reading> opening tag, so one alternation finds
+# them in a single scan.  The branches are lookaheads so an English match's
+# [^(]{0,30} gap can't swallow a hiragana tag inside it:
+#   1. <reading>EnglishName</reading>...(hiragana)
+#   2. <reading>hiragana</reading>trailing_hiragana (forms a name)
+_READING_TAG_RE = re.compile(
+    r"<reading>(?="
+    r"(?P<eng>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)</reading>"
+    r"[^(]{0,30}\((?P<eng_reading>[ぁ-ゖァ-ヶー]+)\)"
+    r"|(?P<hir>[ぁ-ゖ]+)</reading>(?P<suffix>[ぁ-ゖ]+)"
+    r")"
+)
+
+
+def _iter_associations(text: str) -> Iterator[tuple[str, str]]:
+    """Yield the (reading, character name) pairs found in one mnemonic."""
+    english = []
+    hiragana = []
+    eng_end = 0
+    for m in _READING_TAG_RE.finditer(text):
+        if m["hir"] is not None:
+            hiragana.append((m["hir"], m["suffix"]))
+        elif m.start() >= eng_end:
+            # English matches don't overlap each other (as with findall)
+            eng_end = m.end("eng_reading") + 1
+            english.append((m["eng"], m["eng_reading"]))
+
+    # Pattern 1: English name
+    for name, reading in english:
+        yield _katakana_to_hiragana(reading), name
+
+    # Pattern 2: Hiragana reading + suffix = name
+    for reading, suffix in hiragana:
+        full_name = reading + suffix
+        if suffix and len(full_name) >= 2:
+            yield reading, full_name
+
+
+def _count_associations(texts: Iterable[str]) -> dict[str, Counter]:
+    """Count reading → character name pairs across mnemonics.
+
+    All pairs are tallied by one C-level Counter, then split per reading.
+    Counter keeps first-seen order, so most_common() ties break as if each
+    hit had been counted one at a time.
+    """
+    pair_counts = Counter(pair for text in texts for pair in _iter_associations(text))
+    associations: dict[str, Counter] = defaultdict(Counter)
+    for (reading, name), count in pair_counts.items():
+        associations[reading][name] = count
+    return associations
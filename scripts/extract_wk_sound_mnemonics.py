@@ -18,48 +18,25 @@ Output: wk_sound_mnemonics_draft.json for manual curation, plus a
 
 import json
 import os
-import re
-from collections import Counter, defaultdict
+from collections import Counter
 
-import requests
 from dotenv import load_dotenv
 
-WK_API_BASE = "https://api.wanikani.com/v2"
-
-
-def fetch_kanji_reading_mnemonics(api_key: str) -> list[dict]:
-    """Fetch all kanji subjects with reading_mnemonic fields."""
-    headers = {"Authorization": f"Bearer {api_key}"}
-    results = []
-    url = f"{WK_API_BASE}/subjects?types=kanji"
-
-    page = 0
-    while url:
-        page += 1
-        print(f"  Fetching page {page}...", end="\r")
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-        for item in payload["data"]:
-            d = item["data"]
-            rm = d.get("reading_mnemonic", "")
-            if rm:
-                results.append(
-                    {
-                        "characters": d.get("characters", ""),
-                        "readings": {
-                            r["reading"]: r["type"] for r in d.get("readings", [])
-                        },
-                        "primary": [
-                            r["reading"] for r in d.get("readings", []) if r["primary"]
-                        ],
-                        "reading_mnemonic": rm,
-                    }
-                )
-        url = payload["pages"].get("next_url")
-
-    print(f"  Fetched {len(results)} kanji with reading mnemonics.    ")
-    return results
+from _wk_common import _count_associations, fetch_kanji_reading_mnemonics
+
+# Phrases that suggest a mnemonic is introducing a character
+INTRO_KEYWORDS = (
+    "character",
+    "use",
+    "meet",
+    "every time",
+    "introduce",
+    "he's",
+    "she's",
+    "who is",
+    "will be",
+    "remember",
+)
 
 
 def extract_associations(items: list[dict]) -> dict[str, Counter]:
@@ -69,33 +46,8 @@ def extract_associations(items: list[dict]) -> dict[str, Counter]:
       1. <reading>EnglishName</reading>...(hiragana)
       2. <reading>hiragana</reading>trailing_hiragana (forms a name)
     """
-    # Pattern 1: English name in <reading> tag, hiragana reading in parens
-    p_english = re.compile(
-        r"<reading>([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)</reading>"
-        r"[^(]{0,30}\(([ぁ-ゖァ-ヶー]+)\)"
-    )
-
-    # Pattern 2: Hiragana in <reading> tag, followed by more hiragana
-    p_hiragana = re.compile(r"<reading>([ぁ-ゖ]+)</reading>([ぁ-ゖ]+)")
-
     # reading (hiragana) -> {character_name: count}
-    associations: dict[str, Counter] = defaultdict(Counter)
-
-    for item in items:
-        text = item["reading_mnemonic"]
-
-        # Pattern 1: English name
-        for name, reading in p_english.findall(text):
-            reading_h = _katakana_to_hiragana(reading)
-            associations[reading_h][name] += 1
-
-        # Pattern 2: Hiragana reading + suffix = name
-        for reading, suffix in p_hiragana.findall(text):
-            full_name = reading + suffix
-            if suffix and len(full_name) >= 2:
-                associations[reading][full_name] += 1
-
-    return associations
+    return _count_associations(item["reading_mnemonic"] for item in items)
 
 
 def find_character_intros(
@@ -106,37 +58,23 @@ def find_character_intros(
 
     for item in items:
         text = item["reading_mnemonic"]
+        text_len = len(text)
         for name in character_names:
-            if name not in text:
-                continue
+            # One scan gives both the membership test and the match position
             idx = text.find(name)
+            if idx == -1:
+                continue
             start = max(0, idx - 80)
-            end = min(len(text), idx + len(name) + 150)
+            end = min(text_len, idx + len(name) + 150)
             context = text[start:end].replace("\n", " ").strip()
             # Prefer introductions
-            intro_keywords = [
-                "character",
-                "use",
-                "meet",
-                "every time",
-                "introduce",
-                "he's",
-                "she's",
-                "who is",
-                "will be",
-                "remember",
-            ]
-            if any(kw in context.lower() for kw in intro_keywords):
+            lower = context.lower()
+            if any(kw in lower for kw in INTRO_KEYWORDS):
                 if name not in intros or len(context) > len(intros[name]):
                     intros[name] = context
     return intros
 
 
-def _katakana_to_hiragana(text: str) -> str:
-    """Convert katakana to hiragana."""
-    return "".join(chr(ord(c) - 0x60) if "\u30a1" <= c <= "\u30f6" else c for c in text)
-
-
 def main():
     load_dotenv()
     load_dotenv(os.path.expanduser("~/.config/kanji/.env"))
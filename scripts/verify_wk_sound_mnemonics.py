@@ -18,12 +18,13 @@ import json
 import os
 import re
 from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
 
-import requests
 from dotenv import load_dotenv
 
-WK_API_BASE = "https://api.wanikani.com/v2"
+from _wk_common import _count_associations, fetch_kanji_reading_mnemonics
+
 SCRIPT_DIR = Path(__file__).parent
 CACHE_PATH = SCRIPT_DIR / ".wk_mnemonic_cache.json"
 DB_PATH = SCRIPT_DIR.parent / "kanji_mnemonic" / "wk_sound_mnemonics.json"
@@ -31,6 +32,9 @@ DB_PATH = SCRIPT_DIR.parent / "kanji_mnemonic" / "wk_sound_mnemonics.json"
 # Short/common English words that need word-boundary matching
 COMMON_WORDS = {"Go", "No", "Ha", "Jo", "Bo", "Me", "Ra", "Ya", "Eh", "Ah", "Ok"}
 
+_HTML_RE = re.compile(r"<[^>]+>")
+_PAREN_RE = re.compile(r"\(([^)]+)\)")
+
 
 def fetch_or_load_cached(api_key: str, *, no_cache: bool = False) -> list[dict]:
     """Fetch kanji subjects from WK API, with local caching."""
@@ -38,72 +42,42 @@ def fetch_or_load_cached(api_key: str, *, no_cache: bool = False) -> list[dict]:
         print(f"  Loading cached data from {CACHE_PATH.name}...")
         return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
 
-    headers = {"Authorization": f"Bearer {api_key}"}
-    results = []
-    url = f"{WK_API_BASE}/subjects?types=kanji"
-
-    page = 0
-    while url:
-        page += 1
-        print(f"  Fetching page {page}...", end="\r")
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-        for item in payload["data"]:
-            d = item["data"]
-            rm = d.get("reading_mnemonic", "")
-            if rm:
-                results.append(
-                    {
-                        "characters": d.get("characters", ""),
-                        "readings": {
-                            r["reading"]: r["type"] for r in d.get("readings", [])
-                        },
-                        "primary": [
-                            r["reading"] for r in d.get("readings", []) if r["primary"]
-                        ],
-                        "reading_mnemonic": rm,
-                    }
-                )
-        url = payload["pages"].get("next_url")
-
-    print(f"  Fetched {len(results)} kanji with reading mnemonics.    ")
-    CACHE_PATH.write_text(
-        json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    results = fetch_kanji_reading_mnemonics(api_key)
+    CACHE_PATH.write_text(json.dumps(results, ensure_ascii=False), encoding="utf-8")
     print(f"  Cached to {CACHE_PATH.name}")
     return results
 
 
-def _katakana_to_hiragana(text: str) -> str:
-    """Convert katakana to hiragana."""
-    return "".join(chr(ord(c) - 0x60) if "\u30a1" <= c <= "\u30f6" else c for c in text)
-
-
 def _strip_html(text: str) -> str:
     """Strip HTML tags from text."""
-    return re.sub(r"<[^>]+>", "", text)
+    return _HTML_RE.sub("", text)
+
 
+@lru_cache(maxsize=None)
+def _word_re(name: str) -> re.Pattern:
+    """Compiled word-boundary pattern for a name (cached per name)."""
+    return re.compile(rf"\b{re.escape(name)}\b")
 
-def _name_in_text(name: str, text: str) -> bool:
-    """Check if a character name appears in text.
 
-    Strips HTML tags first (WK wraps parts of names in <reading> tags,
-    e.g., <reading>Jo</reading>-Anne). Uses word-boundary matching for
-    short/common English words to avoid false positives.
+def _name_in_clean(name: str, clean: str) -> bool:
+    """Check if a character name appears in HTML-stripped text.
+
+    Callers strip HTML tags first with _strip_html (WK wraps parts of names
+    in <reading> tags, e.g., <reading>Jo</reading>-Anne). Uses word-boundary
+    matching for short/common English words to avoid false positives.
     """
-    clean = _strip_html(text)
+    # A boundary match implies a substring match, so the cheap test goes first
+    if name not in clean:
+        return False
     if name in COMMON_WORDS:
-        return bool(re.search(rf"\b{re.escape(name)}\b", clean))
-    return name in clean
+        return bool(_word_re(name).search(clean))
+    return True
 
 
-def _extract_context(name: str, text: str, width: int = 80) -> str:
-    """Extract context around a name match in text."""
-    # Strip HTML tags for cleaner display
-    clean = re.sub(r"<[^>]+>", "", text)
+def _extract_context(name: str, clean: str, width: int = 80) -> str:
+    """Extract context around a name match in HTML-stripped text."""
     if name in COMMON_WORDS:
-        m = re.search(rf"\b{re.escape(name)}\b", clean)
+        m = _word_re(name).search(clean)
         if not m:
             return ""
         idx = m.start()
@@ -117,68 +91,92 @@ def _extract_context(name: str, text: str, width: int = 80) -> str:
     return f"...{snippet}..."
 
 
+def _search_names(char_name: str) -> list[str]:
+    """Names to look for in mnemonics for a database character name.
+
+    Strips parenthetical from character name for matching,
+    e.g., "Koichi (こういち)" -> search for both "Koichi" and "こういち".
+    """
+    search_names = [char_name]
+    paren_match = _PAREN_RE.search(char_name)
+    if paren_match:
+        search_names.append(paren_match.group(1))
+        search_names.append(char_name.split("(")[0].strip())
+    return search_names
+
+
 def verify_entries(db: dict, items: list[dict]) -> tuple[list[dict], list[dict]]:
     """Verify each database entry against WK mnemonic data.
 
+    Each mnemonic is scanned once for every distinct search name, and the
+    hits are credited to the entries that use that name.
+
     Returns (verified, flagged) lists.
     """
+    entries = sorted(db.items())
+    readings = [reading for reading, _ in entries]
+    names_per_entry = [_search_names(info["character"]) for _, info in entries]
+    entries_by_name: dict[str, list[int]] = defaultdict(list)
+    for idx, names in enumerate(names_per_entry):
+        for n in dict.fromkeys(names):
+            entries_by_name[n].append(idx)
+
+    # Kanji count per primary reading
+    kanji_per_reading: Counter = Counter()
+    for item in items:
+        kanji_per_reading.update(set(item["primary"]))
+
+    # Count mentions in kanji with this reading, and across ALL kanji
+    mentions_for_reading = [0] * len(entries)
+    mentions_total = [0] * len(entries)
+    sample_contexts: list[list[str]] = [[] for _ in entries]
+
+    # Strip HTML once per item rather than once per (entry, item, name)
+    clean_texts = [_strip_html(item["reading_mnemonic"]) for item in items]
+
+    for item, clean in zip(items, clean_texts):
+        primary = item["primary"]
+        hit_entries = {
+            idx
+            for n, idxs in entries_by_name.items()
+            if _name_in_clean(n, clean)
+            for idx in idxs
+        }
+        for idx in hit_entries:
+            mentions_total[idx] += 1
+            if readings[idx] in primary:
+                mentions_for_reading[idx] += 1
+            contexts = sample_contexts[idx]
+            if len(contexts) < 3:
+                for n in names_per_entry[idx]:
+                    ctx = _extract_context(n, clean)
+                    if ctx:
+                        contexts.append(f"{item['characters']}: {ctx}")
+                        break
+
     verified = []
     flagged = []
 
-    for reading, info in sorted(db.items()):
-        char_name = info["character"]
-        # Strip parenthetical from character name for matching
-        # e.g., "Koichi (こういち)" -> search for both "Koichi" and "こういち"
-        search_names = [char_name]
-        paren_match = re.search(r"\(([^)]+)\)", char_name)
-        if paren_match:
-            search_names.append(paren_match.group(1))
-            search_names.append(char_name.split("(")[0].strip())
-
-        # Find kanji with this primary reading
-        kanji_with_reading = [item for item in items if reading in item["primary"]]
-
-        # Count mentions in kanji with this reading
-        mentions_for_reading = 0
-        # Count mentions across ALL kanji
-        mentions_total = 0
-        sample_contexts = []
-
-        for item in items:
-            text = item["reading_mnemonic"]
-            found = any(_name_in_text(n, text) for n in search_names)
-            if found:
-                mentions_total += 1
-                if reading in item["primary"]:
-                    mentions_for_reading += 1
-                if len(sample_contexts) < 3:
-                    for n in search_names:
-                        ctx = _extract_context(n, text)
-                        if ctx:
-                            sample_contexts.append(f"{item['characters']}: {ctx}")
-                            break
-
+    for idx, (reading, info) in enumerate(entries):
+        total = mentions_total[idx]
+        for_reading = mentions_for_reading[idx]
         entry = {
             "reading": reading,
-            "character": char_name,
+            "character": info["character"],
             "description": info["description"],
-            "kanji_with_reading": len(kanji_with_reading),
-            "mentions_for_reading": mentions_for_reading,
-            "mentions_total": mentions_total,
-            "sample_contexts": sample_contexts,
+            "kanji_with_reading": kanji_per_reading[reading],
+            "mentions_for_reading": for_reading,
+            "mentions_total": total,
+            "sample_contexts": sample_contexts[idx],
             "flag": None,
         }
 
-        if mentions_total == 0:
+        if total == 0:
             entry["flag"] = "NOT FOUND in any mnemonic"
-        elif mentions_for_reading == 0:
-            entry["flag"] = (
-                f"Found {mentions_total}x total but NEVER for {reading} reading"
-            )
-        elif mentions_for_reading < 3:
-            entry["flag"] = (
-                f"LOW confidence ({mentions_for_reading} mentions for {reading})"
-            )
+        elif for_reading == 0:
+            entry["flag"] = f"Found {total}x total but NEVER for {reading} reading"
+        elif for_reading < 3:
+            entry["flag"] = f"LOW confidence ({for_reading} mentions for {reading})"
 
         if entry["flag"]:
             flagged.append(entry)
@@ -190,24 +188,8 @@ def verify_entries(db: dict, items: list[dict]) -> tuple[list[dict], list[dict]]
 
 def find_missed(items: list[dict], existing_readings: set[str]) -> list[dict]:
     """Find consistent character→reading associations not in the database."""
-    # Same regex patterns as extraction script
-    p_english = re.compile(
-        r"<reading>([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)</reading>"
-        r"[^(]{0,30}\(([ぁ-ゖァ-ヶー]+)\)"
-    )
-    p_hiragana = re.compile(r"<reading>([ぁ-ゖ]+)</reading>([ぁ-ゖ]+)")
-
-    associations: dict[str, Counter] = defaultdict(Counter)
-
-    for item in items:
-        text = item["reading_mnemonic"]
-        for name, reading in p_english.findall(text):
-            reading_h = _katakana_to_hiragana(reading)
-            associations[reading_h][name] += 1
-        for reading, suffix in p_hiragana.findall(text):
-            full_name = reading + suffix
-            if suffix and len(full_name) >= 2:
-                associations[reading][full_name] += 1
+    # Same patterns as the extraction script
+    associations = _count_associations(item["reading_mnemonic"] for item in items)
 
     missed = []
     for reading in sorted(associations.keys()):
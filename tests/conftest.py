@@ -1,170 +1,246 @@
-"""Shared fixtures for kanji-mnemonic test suite."""
+"""Shared fixtures for kanji-mnemonic test suite.
+
+The sample_* fixtures are session-scoped and shared by every test that uses
+them, so treat them as read-only; copy before mutating.  The sample DBs are
+wrapped in MappingProxyType so a stray top-level write fails immediately
+instead of leaking into later tests.
+"""
+
+import tempfile
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
+from kanji_mnemonic import cli
+from kanji_mnemonic.lookup import make_kanji_lookup
+
+
+@pytest.fixture(scope="session")
+def cli_parser():
+    """One CLI parser per session, for tests that only check argparse wiring."""
+    return cli.build_parser()
+
+
+@pytest.fixture
+def cached_cli_parser(cli_parser, monkeypatch):
+    """Make main() reuse the session parser; opt in from main() dispatch tests."""
+    monkeypatch.setattr(cli, "build_parser", lambda: cli_parser)
+
 
 @pytest.fixture
 def tmp_cache_dir(tmp_path, monkeypatch):
-    """Redirect CACHE_DIR to a temp directory for all data.py operations."""
+    """Redirect CACHE_DIR to a fresh per-test directory; use when the test writes."""
     monkeypatch.setattr("kanji_mnemonic.data.CACHE_DIR", tmp_path)
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def _shared_empty_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("cache_empty")
+
+
+@pytest.fixture
+def empty_cache_dir(_shared_empty_dir, monkeypatch):
+    """Redirect CACHE_DIR to one session-wide empty directory; never write to it."""
+    monkeypatch.setattr("kanji_mnemonic.data.CACHE_DIR", _shared_empty_dir)
+    return _shared_empty_dir
+
+
+@pytest.fixture(scope="session")
+def _config_root(tmp_path_factory):
+    return tmp_path_factory.mktemp("config")
+
+
 @pytest.fixture
+def config_dir(_config_root, monkeypatch):
+    """Redirect CONFIG_DIR to a fresh, empty directory under one session root."""
+    cfg = Path(tempfile.mkdtemp(dir=_config_root))
+    monkeypatch.setattr("kanji_mnemonic.data.CONFIG_DIR", cfg)
+    return cfg
+
+
+@pytest.fixture
+def patch_many(monkeypatch):
+    """Return patch(module, {name: value}) that monkeypatches each attribute."""
+
+    def patch(module, mapping):
+        for name, value in mapping.items():
+            monkeypatch.setattr(f"{module}.{name}", value)
+
+    return patch
+
+
+@pytest.fixture(scope="session")
 def sample_kanji_db():
     """Minimal Keisei kanji_db with comp_phonetic and hieroglyph entries."""
-    return {
-        "語": {
-            "type": "comp_phonetic",
-            "semantic": "言",
-            "phonetic": "吾",
-            "decomposition": ["言", "吾"],
-            "readings": ["ゴ"],
-        },
-        "山": {
-            "type": "hieroglyph",
-            "semantic": None,
-            "phonetic": None,
-            "decomposition": ["山"],
-            "readings": ["サン"],
-        },
-        "話": {
-            "type": "comp_phonetic",
-            "semantic": "言",
-            "phonetic": "舌",
-            "decomposition": ["言", "舌"],
-            "readings": ["ワ"],
-        },
-    }
+    return MappingProxyType(
+        {
+            "語": {
+                "type": "comp_phonetic",
+                "semantic": "言",
+                "phonetic": "吾",
+                "decomposition": ["言", "吾"],
+                "readings": ["ゴ"],
+            },
+            "山": {
+                "type": "hieroglyph",
+                "semantic": None,
+                "phonetic": None,
+                "decomposition": ["山"],
+                "readings": ["サン"],
+            },
+            "話": {
+                "type": "comp_phonetic",
+                "semantic": "言",
+                "phonetic": "舌",
+                "decomposition": ["言", "舌"],
+                "readings": ["ワ"],
+            },
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_phonetic_db():
     """Phonetic families matching sample_kanji_db entries."""
-    return {
-        "吾": {
-            "readings": ["ゴ"],
-            "wk-radical": "five-mouths",
-            "compounds": ["語", "悟", "誤"],
-            "non_compounds": ["唔"],
-            "xrefs": [],
-        },
-        "舌": {
-            "readings": ["ワ"],
-            "wk-radical": None,
-            "compounds": ["話", "活"],
-            "non_compounds": [],
-            "xrefs": [],
-        },
-    }
+    return MappingProxyType(
+        {
+            "吾": {
+                "readings": ["ゴ"],
+                "wk-radical": "five-mouths",
+                "compounds": ["語", "悟", "誤"],
+                "non_compounds": ["唔"],
+                "xrefs": [],
+            },
+            "舌": {
+                "readings": ["ワ"],
+                "wk-radical": None,
+                "compounds": ["話", "活"],
+                "non_compounds": [],
+                "xrefs": [],
+            },
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_wk_kanji_db():
     """WK kanji DB entries with meanings and readings (Keisei format)."""
-    return {
-        "語": {
-            "meaning": "Language",
-            "level": 5,
-            "onyomi": "ゴ",
-            "kunyomi": "かた.る",
-            "important_reading": "onyomi",
-        },
-        "山": {
-            "meaning": "Mountain",
-            "level": 1,
-            "onyomi": "サン",
-            "kunyomi": "やま",
-            "important_reading": "kunyomi",
-        },
-        "悟": {
-            "meaning": "Enlightenment",
-            "level": 30,
-            "onyomi": "ゴ",
-            "kunyomi": "さと.る",
-            "important_reading": "onyomi",
-        },
-        "誤": {
-            "meaning": "Mistake",
-            "level": 32,
-            "onyomi": "ゴ",
-            "kunyomi": "",
-            "important_reading": "onyomi",
-        },
-        "話": {
-            "meaning": "Talk",
-            "level": 5,
-            "onyomi": "ワ",
-            "kunyomi": "はな.す",
-            "important_reading": "kunyomi",
-        },
-    }
+    return MappingProxyType(
+        {
+            "語": {
+                "meaning": "Language",
+                "level": 5,
+                "onyomi": "ゴ",
+                "kunyomi": "かた.る",
+                "important_reading": "onyomi",
+            },
+            "山": {
+                "meaning": "Mountain",
+                "level": 1,
+                "onyomi": "サン",
+                "kunyomi": "やま",
+                "important_reading": "kunyomi",
+            },
+            "悟": {
+                "meaning": "Enlightenment",
+                "level": 30,
+                "onyomi": "ゴ",
+                "kunyomi": "さと.る",
+                "important_reading": "onyomi",
+            },
+            "誤": {
+                "meaning": "Mistake",
+                "level": 32,
+                "onyomi": "ゴ",
+                "kunyomi": "",
+                "important_reading": "onyomi",
+            },
+            "話": {
+                "meaning": "Talk",
+                "level": 5,
+                "onyomi": "ワ",
+                "kunyomi": "はな.す",
+                "important_reading": "kunyomi",
+            },
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_wk_radicals():
     """WK radical char -> name mapping."""
-    return {
-        "言": {"name": "Say", "level": 2, "slug": "say"},
-        "吾": {"name": "Five Mouths", "level": 10, "slug": "five-mouths"},
-        "山": {"name": "Mountain", "level": 1, "slug": "mountain"},
-        "口": {"name": "Mouth", "level": 1, "slug": "mouth"},
-        "虫": {"name": "Insect", "level": 5, "slug": "insect"},
-        "木": {"name": "Tree", "level": 2, "slug": "tree"},
-        "舌": {"name": "Tongue", "level": 7, "slug": "tongue"},
-    }
+    return MappingProxyType(
+        {
+            "言": {"name": "Say", "level": 2, "slug": "say"},
+            "吾": {"name": "Five Mouths", "level": 10, "slug": "five-mouths"},
+            "山": {"name": "Mountain", "level": 1, "slug": "mountain"},
+            "口": {"name": "Mouth", "level": 1, "slug": "mouth"},
+            "虫": {"name": "Insect", "level": 5, "slug": "insect"},
+            "木": {"name": "Tree", "level": 2, "slug": "tree"},
+            "舌": {"name": "Tongue", "level": 7, "slug": "tongue"},
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_wk_kanji_subjects():
     """WK kanji subjects with component_radicals resolved to characters."""
-    return {
-        "語": {
-            "meanings": ["Language", "Word"],
-            "readings": {"onyomi": ["ゴ"], "kunyomi": ["かた.る"]},
-            "component_radicals": ["言", "吾"],
-            "level": 5,
-        },
-        "山": {
-            "meanings": ["Mountain"],
-            "readings": {"onyomi": ["サン"], "kunyomi": ["やま"]},
-            "component_radicals": ["山"],
-            "level": 1,
-        },
-        "話": {
-            "meanings": ["Talk", "Speak"],
-            "readings": {"onyomi": ["ワ"], "kunyomi": ["はな.す"]},
-            "component_radicals": ["言", "舌"],
-            "level": 5,
-        },
-    }
+    return MappingProxyType(
+        {
+            "語": {
+                "meanings": ["Language", "Word"],
+                "readings": {"onyomi": ["ゴ"], "kunyomi": ["かた.る"]},
+                "component_radicals": ["言", "吾"],
+                "level": 5,
+            },
+            "山": {
+                "meanings": ["Mountain"],
+                "readings": {"onyomi": ["サン"], "kunyomi": ["やま"]},
+                "component_radicals": ["山"],
+                "level": 1,
+            },
+            "話": {
+                "meanings": ["Talk", "Speak"],
+                "readings": {"onyomi": ["ワ"], "kunyomi": ["はな.す"]},
+                "component_radicals": ["言", "舌"],
+                "level": 5,
+            },
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_kradfile():
     """KRADFILE-u decomposition data. Includes entries not in keisei DB."""
-    return {
-        "語": ["言", "五", "口"],
-        "山": ["山"],
-        "蝶": ["虫", "木", "世"],
-        "話": ["言", "舌"],
-    }
+    return MappingProxyType(
+        {
+            "語": ["言", "五", "口"],
+            "山": ["山"],
+            "蝶": ["虫", "木", "世"],
+            "話": ["言", "舌"],
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_personal_decompositions():
     """Sample personal decompositions dict (as returned by load_personal_decompositions)."""
-    return {
-        "語": {
-            "parts": ["言", "吾"],
-            "phonetic": "吾",
-            "semantic": "言",
-        },
-    }
+    return MappingProxyType(
+        {
+            "語": {
+                "parts": ["言", "吾"],
+                "phonetic": "吾",
+                "semantic": "言",
+            },
+        }
+    )
 
 
-@pytest.fixture
-def sample_profile_phonetic(
+@pytest.fixture(scope="session")
+def db_bundle(
     sample_kanji_db,
     sample_phonetic_db,
     sample_wk_kanji_db,
@@ -172,11 +248,8 @@ def sample_profile_phonetic(
     sample_wk_kanji_subjects,
     sample_kradfile,
 ):
-    """Pre-built KanjiProfile for 語 (phonetic-semantic compound)."""
-    from kanji_mnemonic.lookup import lookup_kanji
-
-    return lookup_kanji(
-        "語",
+    """The six sample DBs in the positional order the cmd_* functions take."""
+    return (
         sample_kanji_db,
         sample_phonetic_db,
         sample_wk_kanji_db,
@@ -186,24 +259,19 @@ def sample_profile_phonetic(
     )
 
 
-@pytest.fixture
-def sample_profile_hieroglyph(
-    sample_kanji_db,
-    sample_phonetic_db,
-    sample_wk_kanji_db,
-    sample_wk_radicals,
-    sample_wk_kanji_subjects,
-    sample_kradfile,
-):
-    """Pre-built KanjiProfile for 山 (hieroglyph)."""
-    from kanji_mnemonic.lookup import lookup_kanji
+@pytest.fixture(scope="session")
+def sample_kanji_lookup(db_bundle):
+    """Memoized char -> KanjiProfile lookup over the sample databases."""
+    return cache(make_kanji_lookup(*db_bundle))
 
-    return lookup_kanji(
-        "山",
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    )
+
+@pytest.fixture(scope="session")
+def sample_profile_phonetic(sample_kanji_lookup):
+    """Pre-built KanjiProfile for 語 (phonetic-semantic compound)."""
+    return sample_kanji_lookup("語")
+
+
+@pytest.fixture(scope="session")
+def sample_profile_hieroglyph(sample_kanji_lookup):
+    """Pre-built KanjiProfile for 山 (hieroglyph)."""
+    return sample_kanji_lookup("山")
@@ -2,6 +2,7 @@
 
 import argparse
 import json
+import sys
 
 import pytest
 from unittest.mock import MagicMock
@@ -14,6 +15,40 @@ from kanji_mnemonic.cli import (
     load_all_data,
     main,
 )
+from kanji_mnemonic.data import _freeze
+
+# On-disk WK caches for the no-API-key path, serialized once at import
+_CACHED_RADICALS = {"言": {"name": "Say"}}
+_CACHED_SUBJECTS = {"語": {"meanings": ["Language"]}}
+_CACHED_RADICALS_JSON = json.dumps(_CACHED_RADICALS).encode("utf-8")
+_CACHED_SUBJECTS_JSON = json.dumps(_CACHED_SUBJECTS).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def populated_cache_dir(tmp_path_factory):
+    """A cache dir holding the WK radical and subject caches, written once."""
+    cache_dir = tmp_path_factory.mktemp("wk_cache")
+    (cache_dir / "wk_radicals.json").write_bytes(_CACHED_RADICALS_JSON)
+    (cache_dir / "wk_kanji_subjects.json").write_bytes(_CACHED_SUBJECTS_JSON)
+    return cache_dir
+
+
+_CLI_LOADERS = (
+    "load_kanji_db",
+    "load_phonetic_db",
+    "load_wk_kanji_db",
+    "load_kradfile",
+    "load_kanjidic",
+    "load_personal_radicals",
+    "load_personal_decompositions",
+    "load_reading_overrides",
+)
+
+
+@pytest.fixture
+def stub_cli_loaders(patch_many):
+    """Make every load_* used by load_all_data() return an empty dict."""
+    patch_many("kanji_mnemonic.cli", dict.fromkeys(_CLI_LOADERS, dict))
 
 
 class TestGetWkApiKey:
@@ -31,7 +66,7 @@ class TestGetWkApiKey:
 class TestLoadAllData:
     """Tests for load_all_data()."""
 
-    def test_with_api_key(self, monkeypatch):
+    def test_with_api_key(self, patch_many):
         """When an API key is provided, fetch_wk_radicals and fetch_wk_kanji_subjects are called."""
         mock_kanji_db = {"k": 1}
         mock_phonetic_db = {"p": 2}
@@ -42,25 +77,23 @@ class TestLoadAllData:
 
         mock_kanjidic = {"kd": 7}
 
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kanji_db", lambda: mock_kanji_db)
-        monkeypatch.setattr(
-            "kanji_mnemonic.cli.load_phonetic_db", lambda: mock_phonetic_db
-        )
-        monkeypatch.setattr(
-            "kanji_mnemonic.cli.load_wk_kanji_db", lambda: mock_wk_kanji_db
-        )
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kradfile", lambda: mock_kradfile)
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kanjidic", lambda: mock_kanjidic)
-        monkeypatch.setattr("kanji_mnemonic.cli.load_personal_radicals", lambda: {})
-        monkeypatch.setattr(
-            "kanji_mnemonic.cli.load_personal_decompositions", lambda: {}
-        )
-        monkeypatch.setattr("kanji_mnemonic.cli.load_reading_overrides", lambda: {})
-
         fetch_rad = MagicMock(return_value=mock_wk_radicals)
         fetch_subj = MagicMock(return_value=mock_wk_subjects)
-        monkeypatch.setattr("kanji_mnemonic.cli.fetch_wk_radicals", fetch_rad)
-        monkeypatch.setattr("kanji_mnemonic.cli.fetch_wk_kanji_subjects", fetch_subj)
+        patch_many(
+            "kanji_mnemonic.cli",
+            {
+                "load_kanji_db": lambda: mock_kanji_db,
+                "load_phonetic_db": lambda: mock_phonetic_db,
+                "load_wk_kanji_db": lambda: mock_wk_kanji_db,
+                "load_kradfile": lambda: mock_kradfile,
+                "load_kanjidic": lambda: mock_kanjidic,
+                "load_personal_radicals": lambda: {},
+                "load_personal_decompositions": lambda: {},
+                "load_reading_overrides": lambda: {},
+                "fetch_wk_radicals": fetch_rad,
+                "fetch_wk_kanji_subjects": fetch_subj,
+            },
+        )
 
         result = load_all_data("fake-key")
 
@@ -92,48 +125,22 @@ class TestLoadAllData:
         assert reading_overrides == {}
         assert isinstance(sound_mnemonics, dict)
 
-    def test_without_key_loads_cache(self, tmp_cache_dir, monkeypatch):
+    def test_without_key_loads_cache(
+        self, populated_cache_dir, monkeypatch, stub_cli_loaders
+    ):
         """Without an API key, cached wk_radicals.json and wk_kanji_subjects.json are loaded."""
-        cached_radicals = {"言": {"name": "Say"}}
-        cached_subjects = {"語": {"meanings": ["Language"]}}
-
-        (tmp_cache_dir / "wk_radicals.json").write_text(
-            json.dumps(cached_radicals), encoding="utf-8"
-        )
-        (tmp_cache_dir / "wk_kanji_subjects.json").write_text(
-            json.dumps(cached_subjects), encoding="utf-8"
-        )
-
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kanji_db", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_phonetic_db", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_wk_kanji_db", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kradfile", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kanjidic", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_personal_radicals", lambda: {})
-        monkeypatch.setattr(
-            "kanji_mnemonic.cli.load_personal_decompositions", lambda: {}
-        )
-        monkeypatch.setattr("kanji_mnemonic.cli.load_reading_overrides", lambda: {})
+        monkeypatch.setattr("kanji_mnemonic.data.CACHE_DIR", populated_cache_dir)
 
         result = load_all_data(None)
         _, _, _, wk_radicals, wk_kanji_subjects, _, _, _, _, _, _ = result
 
-        assert wk_radicals == cached_radicals
-        assert wk_kanji_subjects == cached_subjects
+        assert wk_radicals == _freeze(_CACHED_RADICALS)
+        assert wk_kanji_subjects == _freeze(_CACHED_SUBJECTS)
 
-    def test_without_key_no_cache_warns(self, tmp_cache_dir, monkeypatch, capsys):
+    def test_without_key_no_cache_warns(
+        self, empty_cache_dir, stub_cli_loaders, capsys
+    ):
         """Without an API key and no cache, a warning is printed and empty data returned."""
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kanji_db", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_phonetic_db", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_wk_kanji_db", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kradfile", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_kanjidic", lambda: {})
-        monkeypatch.setattr("kanji_mnemonic.cli.load_personal_radicals", lambda: {})
-        monkeypatch.setattr(
-            "kanji_mnemonic.cli.load_personal_decompositions", lambda: {}
-        )
-        monkeypatch.setattr("kanji_mnemonic.cli.load_reading_overrides", lambda: {})
-
         result = load_all_data(None)
         _, _, _, wk_radicals, wk_kanji_subjects, _, _, _, _, _, _ = result
 
@@ -145,6 +152,17 @@ class TestLoadAllData:
         assert "WK_API_KEY" in captured.err
 
 
+@pytest.fixture
+def set_argv(monkeypatch):
+    """Return set_argv(*parts) that swaps sys.argv for the current test."""
+
+    def _set(*parts):
+        monkeypatch.setattr(sys, "argv", list(parts))
+
+    return _set
+
+
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestArgumentParsing:
     """Tests for main() argument parsing and command dispatch."""
 
@@ -168,35 +186,24 @@ class TestArgumentParsing:
 
         return mocks
 
-    def test_lookup_command(self, monkeypatch):
+    @pytest.mark.parametrize(
+        "argv,expected",
+        [
+            (["kanji", "lookup", "語"], "cmd_lookup"),
+            (["kanji", "l", "語"], "cmd_lookup"),
+            (["kanji", "memorize", "語"], "cmd_memorize"),
+            (["kanji", "m", "語"], "cmd_memorize"),
+        ],
+    )
+    def test_dispatch(self, monkeypatch, set_argv, argv, expected):
         mocks = self._setup_mocks(monkeypatch)
-        monkeypatch.setattr("sys.argv", ["kanji", "lookup", "語"])
+        set_argv(*argv)
         main()
-        mocks["cmd_lookup"].assert_called_once()
-        args = mocks["cmd_lookup"].call_args[0][0]
+        mocks[expected].assert_called_once()
+        args = mocks[expected].call_args[0][0]
         assert args.kanji == ["語"]
 
-    def test_lookup_alias_l(self, monkeypatch):
-        mocks = self._setup_mocks(monkeypatch)
-        monkeypatch.setattr("sys.argv", ["kanji", "l", "語"])
-        main()
-        mocks["cmd_lookup"].assert_called_once()
-
-    def test_memorize_command(self, monkeypatch):
-        mocks = self._setup_mocks(monkeypatch)
-        monkeypatch.setattr("sys.argv", ["kanji", "memorize", "語"])
-        main()
-        mocks["cmd_memorize"].assert_called_once()
-        args = mocks["cmd_memorize"].call_args[0][0]
-        assert args.kanji == ["語"]
-
-    def test_memorize_alias_m(self, monkeypatch):
-        mocks = self._setup_mocks(monkeypatch)
-        monkeypatch.setattr("sys.argv", ["kanji", "m", "語"])
-        main()
-        mocks["cmd_memorize"].assert_called_once()
-
-    def test_clear_cache_skips_data_loading(self, monkeypatch):
+    def test_clear_cache_skips_data_loading(self, monkeypatch, set_argv):
         """clear-cache should dispatch to cmd_clear_cache without calling load_all_data."""
         mock_load = MagicMock()
         monkeypatch.setattr("kanji_mnemonic.cli.load_all_data", mock_load)
@@ -204,86 +211,50 @@ class TestArgumentParsing:
         mock_clear = MagicMock()
         monkeypatch.setattr("kanji_mnemonic.cli.cmd_clear_cache", mock_clear)
 
-        monkeypatch.setattr("sys.argv", ["kanji", "clear-cache"])
+        set_argv("kanji", "clear-cache")
         main()
 
         mock_clear.assert_called_once()
         mock_load.assert_not_called()
 
-    def test_no_command_exits(self, monkeypatch):
-        monkeypatch.setattr("sys.argv", ["kanji"])
+    def test_no_command_exits(self, set_argv):
+        set_argv("kanji")
         with pytest.raises(SystemExit) as exc_info:
             main()
         assert exc_info.value.code == 1
 
-    def test_context_flag(self, monkeypatch):
+    def test_context_flag(self, monkeypatch, set_argv):
         mocks = self._setup_mocks(monkeypatch)
-        monkeypatch.setattr(
-            "sys.argv", ["kanji", "prompt", "語", "-c", "focus on onyomi"]
-        )
+        set_argv("kanji", "prompt", "語", "-c", "focus on onyomi")
         main()
         mocks["cmd_prompt"].assert_called_once()
         args = mocks["cmd_prompt"].call_args[0][0]
         assert args.context == "focus on onyomi"
 
 
+@pytest.fixture
+def run_lookup(db_bundle):
+    """Run cmd_lookup for the given kanji over the sample DBs."""
+    args = argparse.Namespace(kanji=None)
+
+    def _run(kanji):
+        args.kanji = kanji
+        cmd_lookup(args, *db_bundle, None, {}, {}, {}, {})
+
+    return _run
+
+
 class TestCmdLookup:
     """Tests for cmd_lookup()."""
 
-    def test_prints_formatted_profile(
-        self,
-        capsys,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        args = argparse.Namespace(kanji=["語"])
-        cmd_lookup(
-            args,
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-            None,
-            {},
-            {},
-            {},
-            {},
-        )
+    def test_prints_formatted_profile(self, capsys, run_lookup):
+        run_lookup(["語"])
         output = capsys.readouterr().out
         assert "═══ 語 ═══" in output
         assert "Language" in output
 
-    def test_multiple_kanji(
-        self,
-        capsys,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        args = argparse.Namespace(kanji=["語", "山"])
-        cmd_lookup(
-            args,
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-            None,
-            {},
-            {},
-            {},
-            {},
-        )
+    def test_multiple_kanji(self, capsys, run_lookup):
+        run_lookup(["語", "山"])
         output = capsys.readouterr().out
         assert "═══ 語 ═══" in output
         assert "═══ 山 ═══" in output
@@ -295,22 +266,12 @@ class TestCmdPrompt:
     def test_prints_system_and_user_prompt(
         self,
         capsys,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
+        db_bundle,
     ):
         args = argparse.Namespace(kanji=["語"], context=None)
         cmd_prompt(
             args,
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
+            *db_bundle,
             None,
             {},
             {},
@@ -324,22 +285,12 @@ class TestCmdPrompt:
     def test_with_context(
         self,
         capsys,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
+        db_bundle,
     ):
         args = argparse.Namespace(kanji=["語"], context="test context")
         cmd_prompt(
             args,
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
+            *db_bundle,
             None,
             {},
             {},
@@ -350,32 +301,54 @@ class TestCmdPrompt:
         assert "test context" in output
 
 
+# Canned streamed responses for the stub client
+_STREAM_TWO_CHUNK = ("Hello ", "world")
+_STREAM_ONE_CHUNK = ("mnemonic text",)
+
+
+class _StubStream:
+    """Context manager standing in for anthropic's MessageStream."""
+
+    def __init__(self, chunks):
+        self.text_stream = iter(chunks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _StubMessages:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def stream(self, **kwargs):
+        return _StubStream(self._chunks)
+
+
+class _StubClient:
+    """Minimal Anthropic client: messages.stream() yields fixed text chunks."""
+
+    def __init__(self, chunks):
+        self.messages = _StubMessages(chunks)
+
+
 class TestCmdMemorize:
     """Tests for cmd_memorize()."""
 
     def _make_mock_client(self, text_chunks):
-        """Create a mock Anthropic client whose stream yields the given text chunks."""
-        mock_client = MagicMock()
-        mock_stream = MagicMock()
-        mock_stream.__enter__ = MagicMock(return_value=mock_stream)
-        mock_stream.__exit__ = MagicMock(return_value=False)
-        mock_stream.text_stream = iter(text_chunks)
-        mock_client.messages.stream.return_value = mock_stream
-        return mock_client
+        """Create a stub Anthropic client whose stream yields the given text chunks."""
+        return _StubClient(text_chunks)
 
     def test_streams_response(
         self,
         capsys,
         monkeypatch,
         tmp_cache_dir,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
+        db_bundle,
     ):
-        mock_client = self._make_mock_client(["Hello ", "world"])
+        mock_client = self._make_mock_client(_STREAM_TWO_CHUNK)
         monkeypatch.setattr(
             "kanji_mnemonic.cli.get_anthropic_client", lambda: mock_client
         )
@@ -386,12 +359,7 @@ class TestCmdMemorize:
         )
         cmd_memorize(
             args,
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
+            *db_bundle,
             None,
             {},
             {},
@@ -406,14 +374,9 @@ class TestCmdMemorize:
         capsys,
         monkeypatch,
         tmp_cache_dir,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
+        db_bundle,
     ):
-        mock_client = self._make_mock_client(["mnemonic text"])
+        mock_client = self._make_mock_client(_STREAM_ONE_CHUNK)
         monkeypatch.setattr(
             "kanji_mnemonic.cli.get_anthropic_client", lambda: mock_client
         )
@@ -424,12 +387,7 @@ class TestCmdMemorize:
         )
         cmd_memorize(
             args,
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
+            *db_bundle,
             None,
             {},
             {},
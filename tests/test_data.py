@@ -1,16 +1,22 @@
 """Tests for kanji_mnemonic.data — download, cache, and load databases."""
 
 import json
+import sys
+import threading
+import time
 
 import pytest
 import requests
 import responses
+from responses import matchers
 
 from kanji_mnemonic.data import (
     DB_URLS,
     KRADFILE_URLS,
     WK_API_BASE,
+    _SESSION,
     _download_json,
+    _freeze,
     _load_or_download,
     clear_cache,
     fetch_wk_kanji_subjects,
@@ -59,6 +65,19 @@ class TestDownloadJson:
         with pytest.raises(ConnectionError):
             _download_json(url)
 
+    @responses.activate
+    def test_reuses_shared_session(self):
+        """Downloads go through the module-level session, which retries 5xx."""
+        url = "https://example.com/data.json"
+        responses.add(responses.GET, url, json={}, status=200)
+
+        _download_json(url)
+
+        assert responses.calls[0].request.url == url
+        retry = _SESSION.get_adapter(url).max_retries
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+
 
 # ---------------------------------------------------------------------------
 # TestLoadOrDownload
@@ -83,6 +102,32 @@ class TestLoadOrDownload:
         assert cache_file.exists()
         assert json.loads(cache_file.read_text(encoding="utf-8")) == expected
 
+    @responses.activate
+    def test_cache_write_leaves_no_temp_file(self, tmp_cache_dir):
+        """The cache is written via a temp file that is renamed into place."""
+        url = "https://example.com/db.json"
+        responses.add(responses.GET, url, json={"kanji": "語"}, status=200)
+
+        _load_or_download("test_db", url)
+
+        assert [p.name for p in tmp_cache_dir.iterdir()] == ["test_db.json"]
+
+    @responses.activate
+    def test_failed_cache_write_removes_temp_file(self, tmp_cache_dir, monkeypatch):
+        """If the rename into place fails, the error propagates and no temp file is left."""
+        url = "https://example.com/db.json"
+        responses.add(responses.GET, url, json={"kanji": "語"}, status=200)
+
+        def fail_replace(src, dst):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr("kanji_mnemonic.data.os.replace", fail_replace)
+
+        with pytest.raises(OSError):
+            _load_or_download("test_db", url)
+
+        assert list(tmp_cache_dir.iterdir()) == []
+
     def test_cache_hit_no_download(self, tmp_cache_dir):
         """When the cache file already exists, data is loaded from disk with no
         HTTP request (no responses mock registered, so any request would fail)."""
@@ -108,6 +153,34 @@ class TestLoadOrDownload:
         cache_file = tmp_cache_dir / "broken_db.json"
         assert not cache_file.exists()
 
+    def test_cache_hit_interns_characters(self, tmp_cache_dir):
+        """Keys and single-character values loaded from cache are interned."""
+        cache_file = tmp_cache_dir / "test_db.json"
+        cache_file.write_text(
+            json.dumps({"語": ["言", "吾"]}, ensure_ascii=False), encoding="utf-8"
+        )
+
+        result = _load_or_download("test_db", "https://example.com/unused")
+
+        key = next(iter(result))
+        assert key is sys.intern("語")
+        assert result["語"][0] is sys.intern("言")
+
+
+class TestFreeze:
+    """Tests for _freeze — canonical, read-only form of loaded databases."""
+
+    def test_lists_become_tuples(self):
+        data = {"語": {"parts": ["言", "吾"], "meaning": "Language", "level": 5}}
+        assert _freeze(data) == {
+            "語": {"parts": ("言", "吾"), "meaning": "Language", "level": 5}
+        }
+
+    def test_multi_char_values_untouched(self):
+        meaning = "".join(["Lang", "uage"])
+        result = _freeze({"語": meaning})
+        assert result["語"] is meaning
+
 
 # ---------------------------------------------------------------------------
 # TestLoadWrappers
@@ -134,7 +207,7 @@ class TestLoadWrappers:
 
         result = load_phonetic_db()
 
-        assert result == expected
+        assert result == _freeze(expected)
 
     @responses.activate
     def test_load_wk_kanji_db(self, tmp_cache_dir):
@@ -351,7 +424,7 @@ class TestFetchWkKanjiSubjects:
 
         result = fetch_wk_kanji_subjects("fake-key")
 
-        assert result == cached
+        assert result == _freeze(cached)
 
     @responses.activate
     def test_two_pass_fetch(self, tmp_cache_dir):
@@ -390,10 +463,10 @@ class TestFetchWkKanjiSubjects:
         result = fetch_wk_kanji_subjects("fake-key")
 
         assert "語" in result
-        assert result["語"]["meanings"] == ["Language"]
-        assert result["語"]["readings"]["onyomi"] == ["ゴ"]
-        assert result["語"]["readings"]["kunyomi"] == ["かた.る"]
-        assert result["語"]["component_radicals"] == ["言"]
+        assert result["語"]["meanings"] == ("Language",)
+        assert result["語"]["readings"]["onyomi"] == ("ゴ",)
+        assert result["語"]["readings"]["kunyomi"] == ("かた.る",)
+        assert result["語"]["component_radicals"] == ("言",)
         assert result["語"]["level"] == 5
 
     @responses.activate
@@ -434,7 +507,7 @@ class TestFetchWkKanjiSubjects:
 
         result = fetch_wk_kanji_subjects("fake-key")
 
-        assert result["語"]["component_radicals"] == ["言", "五"]
+        assert result["語"]["component_radicals"] == ("言", "五")
 
     @responses.activate
     def test_skips_image_only_radical_in_id_map(self, tmp_cache_dir):
@@ -475,7 +548,38 @@ class TestFetchWkKanjiSubjects:
         result = fetch_wk_kanji_subjects("fake-key")
 
         # Only the radical with a character is resolved; the image-only one is skipped.
-        assert result["語"]["component_radicals"] == ["言"]
+        assert result["語"]["component_radicals"] == ("言",)
+
+    @responses.activate
+    def test_kanji_error_does_not_wait_for_radicals(self, tmp_cache_dir):
+        """A failed kanji walk raises without waiting on the radical walk."""
+        release = threading.Event()
+
+        def hanging_radicals(request):
+            release.wait(5)
+            return 200, {}, json.dumps(_wk_radical_page([]))
+
+        responses.add_callback(
+            responses.GET,
+            f"{WK_API_BASE}/subjects",
+            callback=hanging_radicals,
+            match=[matchers.query_param_matcher({"types": "radical"})],
+        )
+        responses.add(
+            responses.GET,
+            f"{WK_API_BASE}/subjects?types=kanji",
+            status=401,
+        )
+
+        start = time.monotonic()
+        try:
+            with pytest.raises(requests.exceptions.HTTPError):
+                fetch_wk_kanji_subjects("fake-key")
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 5
+        assert not (tmp_cache_dir / "wk_kanji_subjects.json").exists()
 
 
 # ---------------------------------------------------------------------------
@@ -511,7 +615,7 @@ class TestLoadKradfile:
 
         result = load_kradfile()
 
-        assert result == cached
+        assert result == _freeze(cached)
 
     @responses.activate
     def test_download_and_parse(self, tmp_cache_dir):
@@ -525,8 +629,8 @@ class TestLoadKradfile:
 
         result = load_kradfile()
 
-        assert result["語"] == ["言", "五", "口"]
-        assert result["山"] == ["山"]
+        assert result["語"] == ("言", "五", "口")
+        assert result["山"] == ("山",)
         assert len(result) == 2
 
     @responses.activate
@@ -545,6 +649,73 @@ class TestLoadKradfile:
         assert "語" in result
         assert "山" in result
 
+    @responses.activate
+    def test_unreachable_mirror_does_not_block(self, tmp_cache_dir):
+        """A mirror that errors at the connection level is skipped."""
+        responses.add(
+            responses.GET,
+            KRADFILE_URLS[0],
+            body=requests.exceptions.ConnectionError(),
+        )
+        responses.add(
+            responses.GET,
+            KRADFILE_URLS[1],
+            body=KRADFILE_SAMPLE_TEXT,
+            status=200,
+        )
+
+        result = load_kradfile()
+
+        assert result["語"] == ("言", "五", "口")
+
+    @responses.activate
+    def test_slow_primary_does_not_block(self, tmp_cache_dir):
+        """A later mirror that answers first wins over a hanging primary."""
+        release = threading.Event()
+
+        def hanging_primary(request):
+            release.wait(5)
+            return 200, {}, "語 : 言\n"
+
+        responses.add_callback(
+            responses.GET, KRADFILE_URLS[0], callback=hanging_primary
+        )
+        responses.add(
+            responses.GET,
+            KRADFILE_URLS[1],
+            body=KRADFILE_SAMPLE_TEXT,
+            status=200,
+        )
+
+        start = time.monotonic()
+        try:
+            result = load_kradfile()
+        finally:
+            release.set()
+
+        assert result["語"] == ("言", "五", "口")
+        assert time.monotonic() - start < 5
+
+    @responses.activate
+    def test_undecodable_mirror_is_skipped(self, tmp_cache_dir):
+        """A 200 body that isn't valid UTF-8 falls through to the next mirror."""
+        responses.add(
+            responses.GET,
+            KRADFILE_URLS[0],
+            body=b"\xff\xfe : \x80",
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            KRADFILE_URLS[1],
+            body=KRADFILE_SAMPLE_TEXT,
+            status=200,
+        )
+
+        result = load_kradfile()
+
+        assert result["語"] == ("言", "五", "口")
+
     @responses.activate
     def test_all_mirrors_fail(self, tmp_cache_dir):
         """When all mirrors fail, returns an empty dict."""
@@ -567,7 +738,7 @@ class TestLoadKradfile:
 
         result = load_kradfile()
 
-        assert result == {"語": ["言", "五", "口"], "山": ["山"]}
+        assert result == {"語": ("言", "五", "口"), "山": ("山",)}
         assert "malformed_line_without_colon" not in result
 
 
@@ -590,6 +761,34 @@ class TestClearCache:
         remaining = list(tmp_cache_dir.iterdir())
         assert remaining == []
 
+    def test_leaves_unrelated_entries(self, tmp_cache_dir):
+        """Only the package's own cache files go; other entries are kept."""
+        (tmp_cache_dir / "kradfile.json").write_text("{}")
+        (tmp_cache_dir / "kanjidic.json.tmp").write_text("{")
+        (tmp_cache_dir / "notes.md").write_text("mine")
+        (tmp_cache_dir / "other").mkdir()
+        (tmp_cache_dir / "other" / "data.json").write_text("{}")
+
+        clear_cache()
+
+        remaining = sorted(p.name for p in tmp_cache_dir.iterdir())
+        assert remaining == ["notes.md", "other"]
+        assert (tmp_cache_dir / "other" / "data.json").exists()
+
+    def test_symlinked_cache_dir(self, tmp_path, monkeypatch):
+        """A symlinked CACHE_DIR is emptied through the link, not replaced."""
+        real = tmp_path / "real-cache"
+        real.mkdir()
+        link = tmp_path / "cache-link"
+        link.symlink_to(real, target_is_directory=True)
+        monkeypatch.setattr("kanji_mnemonic.data.CACHE_DIR", link)
+        (real / "kanji_db.json").write_text("{}")
+
+        clear_cache()
+
+        assert link.is_symlink()
+        assert list(real.iterdir()) == []
+
     def test_no_cache_dir(self, tmp_cache_dir, monkeypatch, capsys):
         """When the cache directory does not exist, prints a message and does
         not raise."""
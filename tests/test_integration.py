@@ -1,191 +1,81 @@
 """Integration tests: lookup_kanji -> format_profile -> build_prompt pipeline."""
 
-from kanji_mnemonic.lookup import lookup_kanji, format_profile
-from kanji_mnemonic.prompt import build_prompt
-
+from functools import cache
 
-class TestPhoneticSemanticPipeline:
-    """Pipeline tests for phonetic-semantic compound kanji (語)."""
-
-    def test_full_pipeline_comp_phonetic(
-        self,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        """lookup_kanji -> format_profile -> build_prompt for 語 produces a complete prompt."""
-        profile = lookup_kanji(
-            "語",
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-        )
-        format_profile(profile)
-        prompt = build_prompt(profile)
-
-        # Profile header is present
-        assert "═══ 語 ═══" in prompt
-        # Prompt requests both mnemonic types
-        assert "Meaning mnemonic" in prompt
-        assert "Reading mnemonic" in prompt
-        # Phonetic-semantic compounds get a phonetic family note request
-        assert "Phonetic family note" in prompt
-        # The WK meaning appears in the formatted profile section
-        assert "Language" in prompt
-
-    def test_phonetic_family_in_prompt(
-        self,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        """Prompt for 語 includes family members 悟 (Enlightenment) and 誤 (Mistake)."""
-        profile = lookup_kanji(
-            "語",
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-        )
-        prompt = build_prompt(profile)
-
-        # Family members and their meanings should appear
-        assert "悟" in prompt
-        assert "Enlightenment" in prompt
-        assert "誤" in prompt
-        assert "Mistake" in prompt
+import pytest
 
+from kanji_mnemonic.lookup import format_profile
+from kanji_mnemonic.prompt import build_prompt
 
-class TestKradfileFallbackPipeline:
-    """Pipeline tests for kanji only present in KRADFILE (蝶)."""
 
-    def test_kradfile_only_kanji(
-        self,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        """Lookup 蝶 (not in kanji_db) completes and has decomposition from kradfile."""
-        profile = lookup_kanji(
-            "蝶",
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-        )
-        format_profile(profile)
-        prompt = build_prompt(profile)
+@pytest.fixture(scope="module")
+def prompt_for(sample_kanji_lookup):
+    """Memoized char -> build_prompt(profile) over the sample databases."""
+    return cache(lambda ch: build_prompt(sample_kanji_lookup(ch)))
 
-        # Pipeline completes without error and produces output
-        assert "蝶" in prompt
-        # Decomposition from kradfile is present on the profile
-        assert profile.decomposition == ["虫", "木", "世"]
 
-    def test_component_names_in_prompt(
-        self,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        """Prompt for 蝶 contains WK radical names 'Insect' (虫) and 'Tree' (木)."""
-        profile = lookup_kanji(
+@pytest.mark.parametrize(
+    "ch, expected_substrings, expected_attrs",
+    [
+        pytest.param(
+            "語",
+            [
+                "═══ 語 ═══",
+                "Meaning mnemonic",
+                "Reading mnemonic",
+                # Phonetic-semantic compounds get a phonetic family note request
+                "Phonetic family note",
+                "Language",
+                # Family members and their meanings
+                "悟",
+                "Enlightenment",
+                "誤",
+                "Mistake",
+            ],
+            {},
+            id="phonetic_semantic",
+        ),
+        pytest.param(
             "蝶",
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-        )
-        prompt = build_prompt(profile)
-
-        assert "Insect" in prompt
-        assert "Tree" in prompt
-
-
-class TestUnknownKanjiPipeline:
-    """Pipeline tests for a kanji absent from all databases (龘)."""
-
-    def test_unknown_kanji(
-        self,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        """Lookup 龘 (not in any database) completes with minimal profile."""
-        profile = lookup_kanji(
+            # WK radical names for 虫 and 木
+            ["蝶", "Insect", "Tree"],
+            # Decomposition comes from kradfile (蝶 is not in kanji_db)
+            {"decomposition": ["虫", "木", "世"]},
+            id="kradfile_fallback",
+        ),
+        pytest.param(
             "龘",
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-        )
-        format_profile(profile)
-        prompt = build_prompt(profile)
-
-        # Pipeline completes and the character is present
-        assert profile.character == "龘"
-        assert "龘" in prompt
-        # Minimal profile: no meaning, no keisei type
-        assert profile.wk_meaning is None
-        assert profile.keisei_type is None
-
-    def test_empty_profile_prompt_structure(
-        self,
-        sample_kanji_db,
-        sample_phonetic_db,
-        sample_wk_kanji_db,
-        sample_wk_radicals,
-        sample_wk_kanji_subjects,
-        sample_kradfile,
-    ):
-        """Prompt for 龘 still contains the essential mnemonic generation instructions."""
-        profile = lookup_kanji(
-            "龘",
-            sample_kanji_db,
-            sample_phonetic_db,
-            sample_wk_kanji_db,
-            sample_wk_radicals,
-            sample_wk_kanji_subjects,
-            sample_kradfile,
-        )
-        prompt = build_prompt(profile)
-
-        assert "Generate a mnemonic" in prompt
-        assert "Meaning mnemonic" in prompt
-        assert "Reading mnemonic" in prompt
+            ["龘", "Generate a mnemonic", "Meaning mnemonic", "Reading mnemonic"],
+            # Minimal profile: no meaning, no keisei type
+            {"character": "龘", "wk_meaning": None, "keisei_type": None},
+            id="unknown_kanji",
+        ),
+    ],
+)
+def test_full_pipeline(
+    sample_kanji_lookup, prompt_for, ch, expected_substrings, expected_attrs
+):
+    """lookup_kanji -> format_profile -> build_prompt completes and covers the profile."""
+    profile = sample_kanji_lookup(ch)
+    prompt = prompt_for(ch)
+
+    assert format_profile(profile) in prompt
+    missing = [
+        substring for substring in expected_substrings if substring not in prompt
+    ]
+    assert not missing
+    for attr, expected in expected_attrs.items():
+        assert getattr(profile, attr) == expected
 
 
 class TestFormatProfileEmbedding:
     """Verify that the formatted profile is embedded verbatim in the prompt."""
 
-    def test_format_profile_is_substring_of_prompt(self, sample_profile_phonetic):
+    def test_format_profile_is_substring_of_prompt(
+        self, sample_profile_phonetic, prompt_for
+    ):
         """For 語, format_profile(profile) appears as a substring of build_prompt(profile)."""
         formatted = format_profile(sample_profile_phonetic)
-        prompt = build_prompt(sample_profile_phonetic)
+        prompt = prompt_for("語")
 
         assert formatted in prompt
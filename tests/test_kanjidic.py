@@ -37,6 +37,8 @@ import tarfile
 import pytest
 import responses
 
+from kanji_mnemonic.data import _freeze
+
 
 # ---------------------------------------------------------------------------
 # Helpers — build realistic kanjidic2 JSON and tarballs for tests
@@ -453,7 +455,7 @@ class TestLoadKanjidic:
 
         result = load_kanjidic()
 
-        assert result == cached
+        assert result == _freeze(cached)
 
     @responses.activate
     def test_download_and_parse(self, tmp_cache_dir):
@@ -490,15 +492,15 @@ class TestLoadKanjidic:
 
         # Basic structure checks
         assert "亜" in result
-        assert result["亜"]["onyomi"] == ["あ"]  # katakana converted
-        assert result["亜"]["kunyomi"] == ["つ.ぐ"]
+        assert result["亜"]["onyomi"] == ("あ",)  # katakana converted
+        assert result["亜"]["kunyomi"] == ("つ.ぐ",)
         assert "Asia" in result["亜"]["meanings"]
 
         # Cache was written
         cache_file = tmp_cache_dir / "kanjidic.json"
         assert cache_file.exists()
         cached = json.loads(cache_file.read_text(encoding="utf-8"))
-        assert cached == result
+        assert _freeze(cached) == result
 
     @responses.activate
     def test_tarball_extraction(self, tmp_cache_dir):
@@ -1,11 +1,17 @@
 """Comprehensive tests for kanji_mnemonic.lookup module."""
 
+import kanji_mnemonic.lookup as lookup_module
 from kanji_mnemonic.lookup import (
     KanjiProfile,
     _find_name,
     _infer_phonetic_semantic,
+    _kanji_meaning,
+    _kanji_readings,
+    _parse_wk_readings,
     format_profile,
     lookup_kanji,
+    lookup_kanji_many,
+    make_kanji_lookup,
 )
 
 
@@ -796,6 +802,26 @@ class TestKradfileSubsetInference:
         assert "｜" not in component_map
         assert "辶" not in component_map
 
+    def test_replacement_keeps_position_of_first_atom(self):
+        """Replacement radicals are inserted where the first atom was."""
+        profile = lookup_kanji(
+            "X",
+            {},
+            {},
+            {},
+            {},
+            None,
+            kradfile={
+                "X": ["d", "a", "e", "b"],
+                "Y": ["a", "b"],
+            },
+            kanjidic={
+                "X": {"meanings": ["target"], "onyomi": ["か"], "kunyomi": []},
+                "Y": {"meanings": ["source"], "onyomi": ["か"], "kunyomi": []},
+            },
+        )
+        assert [c["char"] for c in profile.wk_components] == ["d", "Y", "e"]
+
     def test_no_wk_subject_uses_kanji_meaning(self):
         """When phonetic component has no WK subject, use its meaning as name."""
         profile = lookup_kanji(
@@ -1241,3 +1267,174 @@ class TestTypeOnlyKeiseiWithKradfileFallback:
         assert "Hieroglyph" in output
         assert "Decomposition:" in output
         assert "一" in output
+
+
+# ---------------------------------------------------------------------------
+# TestMakeKanjiLookup
+# ---------------------------------------------------------------------------
+
+
+class TestMakeKanjiLookup:
+    """Tests for make_kanji_lookup() — databases bound once, one-arg lookups."""
+
+    def test_matches_lookup_kanji(
+        self,
+        sample_kanji_db,
+        sample_phonetic_db,
+        sample_wk_kanji_db,
+        sample_wk_radicals,
+        sample_wk_kanji_subjects,
+        sample_kradfile,
+    ):
+        """The bound lookup returns the same profile as lookup_kanji()."""
+        lookup = make_kanji_lookup(
+            sample_kanji_db,
+            sample_phonetic_db,
+            sample_wk_kanji_db,
+            sample_wk_radicals,
+            sample_wk_kanji_subjects,
+            sample_kradfile,
+        )
+        for char in ("語", "山", "蝶", "龘"):
+            assert lookup(char) == lookup_kanji(
+                char,
+                sample_kanji_db,
+                sample_phonetic_db,
+                sample_wk_kanji_db,
+                sample_wk_radicals,
+                sample_wk_kanji_subjects,
+                sample_kradfile,
+            )
+
+    def test_binds_optional_arguments(
+        self,
+        sample_kanji_db,
+        sample_phonetic_db,
+        sample_wk_kanji_db,
+        sample_wk_radicals,
+    ):
+        """Keyword options like reading_overrides apply to every call."""
+        lookup = make_kanji_lookup(
+            sample_kanji_db,
+            sample_phonetic_db,
+            sample_wk_kanji_db,
+            sample_wk_radicals,
+            personal_radicals={"言": "Speech"},
+            reading_overrides={"語": "kunyomi"},
+        )
+        profile = lookup("語")
+        assert profile.important_reading == "kunyomi"
+        assert {"char": "言", "name": "Speech"} in profile.wk_components
+
+    def test_keeps_one_reading_cache(self, monkeypatch, db_bundle):
+        """Successive calls share the reading cache created at bind time."""
+        seen = []
+        real_lookup = lookup_module.lookup_kanji
+
+        def spy(char, *args, **kwargs):
+            seen.append(kwargs["reading_cache"])
+            return real_lookup(char, *args, **kwargs)
+
+        monkeypatch.setattr(lookup_module, "lookup_kanji", spy)
+        lookup = make_kanji_lookup(*db_bundle)
+        lookup("語")
+        lookup("山")
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
+
+
+class TestLookupKanjiMany:
+    """Tests for lookup_kanji_many() — batch lookups in input order."""
+
+    def test_returns_profiles_in_order(
+        self,
+        sample_kanji_db,
+        sample_phonetic_db,
+        sample_wk_kanji_db,
+        sample_wk_radicals,
+        sample_wk_kanji_subjects,
+        sample_kradfile,
+    ):
+        profiles = lookup_kanji_many(
+            "語山語",
+            sample_kanji_db,
+            sample_phonetic_db,
+            sample_wk_kanji_db,
+            sample_wk_radicals,
+            sample_wk_kanji_subjects,
+            sample_kradfile,
+        )
+        assert [p.character for p in profiles] == ["語", "山", "語"]
+        assert profiles[0].keisei_type == "comp_phonetic"
+        assert profiles[1].keisei_type == "hieroglyph"
+
+    def test_empty_input(self, sample_kanji_db, sample_phonetic_db):
+        assert lookup_kanji_many([], sample_kanji_db, sample_phonetic_db, {}, {}) == []
+
+    def test_shares_one_reading_cache(self, monkeypatch, db_bundle):
+        """Every lookup in the batch gets the same reading cache."""
+        seen = []
+        real_lookup = lookup_module.lookup_kanji
+
+        def spy(char, *args, **kwargs):
+            seen.append(kwargs["reading_cache"])
+            return real_lookup(char, *args, **kwargs)
+
+        monkeypatch.setattr(lookup_module, "lookup_kanji", spy)
+        profiles = lookup_kanji_many("語山蝶", *db_bundle)
+        assert [p.character for p in profiles] == ["語", "山", "蝶"]
+        assert len(seen) == 3
+        assert all(c is seen[0] for c in seen)
+
+    def test_matches_individual_lookups(self, db_bundle):
+        """Sharing the cache doesn't change any profile."""
+        chars = "語山蝶龘語"
+        assert lookup_kanji_many(chars, *db_bundle) == [
+            lookup_kanji(char, *db_bundle) for char in chars
+        ]
+
+
+class TestParseWkReadings:
+    """Tests for _parse_wk_readings() and _kanji_meaning() helpers."""
+
+    def test_onyomi_hiragana_then_kun_stems(self):
+        assert _parse_wk_readings("ゴ, ギョ", "かた.る, かた.らう") == (
+            "ご",
+            "ぎょ",
+            "かた",
+            "かた",
+        )
+
+    def test_empty_fields(self):
+        assert _parse_wk_readings("", "") == ()
+
+    def test_meaning_prefers_wk_kanji_db(self, sample_wk_kanji_db):
+        kanjidic = {"語": {"meanings": ["word"]}}
+        assert _kanji_meaning("語", sample_wk_kanji_db, kanjidic) == "Language"
+
+    def test_meaning_falls_back_to_kanjidic(self):
+        kanjidic = {"蝶": {"meanings": ["butterfly"]}}
+        assert _kanji_meaning("蝶", {}, kanjidic) == "butterfly"
+        assert _kanji_meaning("蝶", {}, None) is None
+
+    def test_meaning_falls_back_past_blank_wk_entry(self):
+        """A wk_kanji_db entry without a meaning doesn't shadow Kanjidic's."""
+        kanjidic = {"蝶": {"meanings": ["butterfly"]}}
+        empty = {"蝶": {"meaning": "", "onyomi": "チョウ"}}
+        missing = {"蝶": {"onyomi": "チョウ"}}
+        assert _kanji_meaning("蝶", empty, kanjidic) == "butterfly"
+        assert _kanji_meaning("蝶", missing, kanjidic) == "butterfly"
+
+    def test_kanji_readings_merges_sources(self, sample_wk_kanji_db):
+        kanjidic = {"語": {"onyomi": ["ぎょ"], "kunyomi": ["かた.る"]}}
+        assert _kanji_readings("語", sample_wk_kanji_db, kanjidic) == {
+            "ご",
+            "ぎょ",
+            "かた",
+        }
+
+    def test_kanji_readings_uses_cache(self, sample_wk_kanji_db):
+        cache = {"語": frozenset({"cached"})}
+        assert _kanji_readings("語", sample_wk_kanji_db, None, cache) == {"cached"}
+        _kanji_readings("山", sample_wk_kanji_db, None, cache)
+        assert cache["山"] == {"さん", "やま"}
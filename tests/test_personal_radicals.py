@@ -16,15 +16,6 @@ from unittest.mock import MagicMock
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def config_dir(tmp_path, monkeypatch):
-    """Redirect personal radicals config dir to a temp directory."""
-    cfg = tmp_path / "config" / "kanji"
-    cfg.mkdir(parents=True)
-    monkeypatch.setattr("kanji_mnemonic.data.CONFIG_DIR", cfg)
-    return cfg
-
-
 @pytest.fixture
 def personal_radicals_file(config_dir):
     """Create a personal radicals JSON file with sample data."""
@@ -386,7 +377,7 @@ class TestNoNameHint:
 class TestCmdName:
     """Tests for 'kanji name' CLI command."""
 
-    def test_adds_radical_name(self, config_dir, capsys):
+    def test_adds_radical_name(self, config_dir):
         """'kanji name 世 World' saves the radical name."""
         from kanji_mnemonic.cli import cmd_name
 
@@ -395,7 +386,7 @@ class TestCmdName:
         data = json.loads((config_dir / "radicals.json").read_text(encoding="utf-8"))
         assert data["世"] == "World"
 
-    def test_updates_existing_name(self, config_dir, personal_radicals_file, capsys):
+    def test_updates_existing_name(self, config_dir, personal_radicals_file):
         """'kanji name 世 Generation' overwrites the existing name."""
         from kanji_mnemonic.cli import cmd_name
 
@@ -453,6 +444,7 @@ class TestCmdNames:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestNameCommandDispatch:
     """Tests for main() routing to name/names commands."""
 
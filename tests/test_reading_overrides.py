@@ -16,15 +16,6 @@ from unittest.mock import MagicMock
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def config_dir(tmp_path, monkeypatch):
-    """Redirect CONFIG_DIR to a temp directory."""
-    cfg = tmp_path / "config" / "kanji"
-    cfg.mkdir(parents=True)
-    monkeypatch.setattr("kanji_mnemonic.data.CONFIG_DIR", cfg)
-    return cfg
-
-
 @pytest.fixture
 def reading_overrides_file(config_dir):
     """Create a reading_overrides.json file with sample data."""
@@ -270,7 +261,7 @@ class TestReadingOverrideInLookup:
 class TestCmdReading:
     """Tests for 'kanji reading' CLI command."""
 
-    def test_saves_reading_override(self, config_dir, capsys):
+    def test_saves_reading_override(self, config_dir):
         from kanji_mnemonic.cli import cmd_reading
 
         args = argparse.Namespace(kanji="詠", reading_type="kunyomi", remove=False)
@@ -297,7 +288,7 @@ class TestCmdReading:
         output = capsys.readouterr().out
         assert "No reading override" in output
 
-    def test_removes_override(self, config_dir, reading_overrides_file, capsys):
+    def test_removes_override(self, config_dir, reading_overrides_file):
         from kanji_mnemonic.cli import cmd_reading
 
         args = argparse.Namespace(kanji="山", reading_type=None, remove=True)
@@ -345,6 +336,7 @@ class TestCmdReadings:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestMemorizePrimaryFlag:
     """Tests for --primary flag on the memorize command."""
 
@@ -397,6 +389,7 @@ class TestMemorizePrimaryFlag:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestReadingCommandDispatch:
     """Tests for main() routing to reading/readings commands."""
 
@@ -21,15 +21,6 @@ import pytest
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def config_dir(tmp_path, monkeypatch):
-    """Redirect CONFIG_DIR to a temp directory for mnemonic storage."""
-    cfg = tmp_path / "config" / "kanji"
-    cfg.mkdir(parents=True)
-    monkeypatch.setattr("kanji_mnemonic.data.CONFIG_DIR", cfg)
-    return cfg
-
-
 @pytest.fixture
 def mnemonics_file(config_dir):
     """Create a mnemonics.json file with sample data."""
@@ -656,6 +647,7 @@ class TestInteractiveQuit:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestNoInteractive:
     """Tests for the --no-interactive / -n flag."""
 
@@ -813,6 +805,7 @@ class TestCmdShow:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestShowCommandDispatch:
     """Tests for main() routing to show command."""
 
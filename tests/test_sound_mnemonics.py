@@ -17,15 +17,6 @@ from kanji_mnemonic.lookup import KanjiProfile
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def config_dir(tmp_path, monkeypatch):
-    """Redirect CONFIG_DIR to a temp directory."""
-    cfg = tmp_path / "config" / "kanji"
-    cfg.mkdir(parents=True)
-    monkeypatch.setattr("kanji_mnemonic.data.CONFIG_DIR", cfg)
-    return cfg
-
-
 @pytest.fixture
 def sample_wk_sound_mnemonics():
     """Sample WK sound mnemonic database."""
@@ -341,6 +332,7 @@ class TestBuildPromptWithSounds:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestLookupSoundFlag:
     """Tests for --sound flag on the lookup command."""
 
@@ -378,6 +370,7 @@ class TestLookupSoundFlag:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestCmdSounds:
     """Tests for 'kanji sounds' CLI command."""
 
@@ -510,7 +503,7 @@ class TestRemovePersonalSoundMnemonic:
 class TestCmdSound:
     """Tests for 'kanji sound' CLI command."""
 
-    def test_saves_sound_mnemonic(self, config_dir, capsys):
+    def test_saves_sound_mnemonic(self, config_dir):
         from kanji_mnemonic.cli import cmd_sound
 
         args = argparse.Namespace(
@@ -546,7 +539,7 @@ class TestCmdSound:
         output = capsys.readouterr().out
         assert "No personal sound mnemonic" in output
 
-    def test_removes_sound(self, config_dir, personal_sound_file, capsys):
+    def test_removes_sound(self, config_dir, personal_sound_file):
         from kanji_mnemonic.cli import cmd_sound
 
         args = argparse.Namespace(
@@ -612,6 +605,7 @@ class TestCmdSoundsOutput:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("cached_cli_parser")
 class TestSoundCommandDispatch:
     """Tests for main() routing to sound/sounds commands."""
 